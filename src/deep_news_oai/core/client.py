@@ -5,6 +5,7 @@ import logging
 import os
 
 import httpx
+import orjson
 
 from deep_news_oai.core.models import SearchRequest, SearchResponse
 
@@ -43,18 +44,41 @@ class BigKindsClient:
         self.max_retries = max_retries
         self.rate_limit_delay = rate_limit_delay
         self._client: httpx.AsyncClient | None = None
+        self._last_request_ts = float("-inf")  # loop.time() of the last request
+        self._rate_lock = asyncio.Lock()
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create async client."""
         if self._client is None or self._client.is_closed:
+            # HTTP/2 multiplexes concurrent searches over one connection
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                verify=False,  # BigKinds has SSL issues
+                retries=0,  # Retries are handled in search()
+                limits=httpx.Limits(
+                    max_connections=200,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=60.0,
+                ),
+            )
             self._client = httpx.AsyncClient(
                 headers=self.DEFAULT_HEADERS,
                 timeout=httpx.Timeout(self.timeout, connect=10.0),
-                verify=False,  # BigKinds has SSL issues
+                transport=transport,
                 follow_redirects=True,
+                trust_env=False,  # Skip proxy env lookups per request
             )
         return self._client
 
+    async def _wait_for_rate_limit(self) -> None:
+        """Enforce a minimum spacing of rate_limit_delay between requests."""
+        async with self._rate_lock:
+            loop = asyncio.get_running_loop()
+            wait = self.rate_limit_delay - (loop.time() - self._last_request_ts)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_request_ts = loop.time()
+
     async def search(self, request: SearchRequest) -> SearchResponse:
         """
         Perform async search request to BigKinds API.
@@ -67,6 +91,8 @@ class BigKindsClient:
         """
         client = await self._get_client()
         payload = request.to_api_payload()
+        # Encode once with orjson; DEFAULT_HEADERS already sets Content-Type
+        body = orjson.dumps(payload)
 
         logger.debug(
             f"BigKinds API request: keyword='{request.keyword}', "
@@ -76,11 +102,12 @@ class BigKindsClient:
         last_error = None
         for attempt in range(self.max_retries):
             try:
-                await asyncio.sleep(self.rate_limit_delay)
+                await self._wait_for_rate_limit()
 
-                response = await client.post(self.API_URL, json=payload)
+                response = await client.post(self.API_URL, content=body)
                 response.raise_for_status()
-                data = response.json()
+                # Decode raw bytes directly (skips httpx text decoding)
+                data = orjson.loads(response.content)
 
                 search_response = SearchResponse.from_api_response(data, request, raw_response=data)
 
@@ -1,34 +1,155 @@
 """Image extraction utilities for news articles."""
 
 import asyncio
+import json
 import logging
 import re
+import threading
+from pathlib import Path
 from typing import Any
+from urllib.parse import urlsplit
 
 import httpx
+from cachetools import LRUCache, TTLCache
 
 logger = logging.getLogger(__name__)
 
-# Regex pattern for og:image meta tag
-OG_IMAGE_PATTERN = re.compile(
-    r'<meta\s+(?:property=["\']og:image["\']\s+content=["\']([^"\']+)["\']|content=["\']([^"\']+)["\']\s+property=["\']og:image["\'])',
-    re.IGNORECASE
+# Single-pass scan over <meta> tags; attributes are parsed per tag so quote
+# style and attribute order don't matter
+META_TAG_PATTERN = re.compile(r"<meta\b[^>]*>", re.IGNORECASE)
+META_ATTR_PATTERN = re.compile(
+    r"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))"""
 )
 
-# Alternative patterns for other image meta tags
-TWITTER_IMAGE_PATTERN = re.compile(
-    r'<meta\s+(?:name=["\']twitter:image["\']\s+content=["\']([^"\']+)["\']|content=["\']([^"\']+)["\']\s+name=["\']twitter:image["\'])',
-    re.IGNORECASE
+
+def _find_meta_image(html: str) -> str | None:
+    """
+    Find og:image (preferred) or twitter:image in one pass over meta tags.
+
+    Args:
+        html: HTML text (usually just the <head> portion)
+
+    Returns:
+        Image URL if found, None otherwise
+    """
+    twitter_image = None
+
+    for tag in META_TAG_PATTERN.finditer(html):
+        tag_text = tag.group(0)
+        # Cheap reject for charset/viewport/description tags
+        if "image" not in tag_text.lower():
+            continue
+
+        attrs = {
+            m.group(1).lower(): m.group(2) or m.group(3) or m.group(4)
+            for m in META_ATTR_PATTERN.finditer(tag_text)
+        }
+        key = (attrs.get("property") or attrs.get("name") or "").lower()
+        content = attrs.get("content")
+        if not content:
+            continue
+
+        if key == "og:image":
+            return content
+        if key == "twitter:image" and twitter_image is None:
+            twitter_image = content
+
+    return twitter_image
+
+
+# Common image extensions and image CDN patterns (see validate_image_url)
+_IMAGE_URL_PATTERN = re.compile(
+    "|".join(
+        re.escape(p)
+        for p in (
+            ".jpg", ".jpeg", ".png", ".gif", ".webp",
+            "/image/", "/images/", "/img/", "/photo/",
+            "wimg.", "img.", "image.", "cdn.",
+        )
+    )
 )
 
+# Hosts whose pages never carry a usable article og:image (video/file hosts)
+_BLOCKED_HOSTS = frozenset({
+    "youtube.com", "youtu.be", "vimeo.com",
+    "tv.naver.com", "tv.kakao.com", "tv.zum.com",
+})
+
+# URL paths that are images already (no page fetch needed) or not HTML
+_DIRECT_IMAGE_SUFFIXES = (".jpg", ".jpeg", ".png", ".gif", ".webp")
+_NON_HTML_SUFFIXES = (".pdf", ".mp4", ".zip", ".hwp")
+
+# Meta tags live in <head>, so only the start of the page is needed
+MAX_HTML_BYTES = 50000
+
+# Shared client for image lookups (created lazily, closed on server shutdown)
+_shared_client: httpx.AsyncClient | None = None
+
 
-async def extract_og_image(url: str, timeout: float = 5.0) -> str | None:
+def _get_shared_client() -> httpx.AsyncClient:
+    """
+    Get or create the shared async client for image lookups.
+
+    Reusing one pooled client lets keep-alive and HTTP/2 amortize the
+    TLS/DNS setup across a batch instead of paying it per URL.
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(5.0),  # Per-request timeouts override this
+            follow_redirects=True,
+            verify=False,  # Some news sites have SSL issues
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=1000,
+                max_keepalive_connections=100,
+                keepalive_expiry=30.0,
+            ),
+            headers={"User-Agent": "Mozilla/5.0 (compatible; DeepNewsBot/1.0)"},
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Flush the extension cache and close the shared image client (server shutdown)."""
+    global _shared_client, _ext_cache_flush_task
+    if _ext_cache_flush_task is not None and not _ext_cache_flush_task.done():
+        _ext_cache_flush_task.cancel()
+    _ext_cache_flush_task = None
+    _save_ext_cache()
+
+    if _shared_client is not None and not _shared_client.is_closed:
+        await _shared_client.aclose()
+        logger.debug("Image client closed")
+    _shared_client = None
+
+
+# og:image results keyed by article URL. Misses are cached for a shorter
+# time so broken pages aren't re-fetched on every search.
+_og_image_cache: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+_og_image_miss_cache: TTLCache = TTLCache(maxsize=4096, ttl=300)
+
+
+def clear_image_cache() -> None:
+    """Clear the og:image result caches. Useful for development/testing."""
+    _og_image_cache.clear()
+    _og_image_miss_cache.clear()
+
+
+async def extract_og_image(
+    url: str,
+    timeout: float = 5.0,
+    client: httpx.AsyncClient | None = None,
+) -> str | None:
     """
     Extract og:image from an article URL.
 
+    Results (including misses) are cached per URL.
+
     Args:
         url: Article URL to fetch
         timeout: Request timeout in seconds
+        client: HTTP client to use (defaults to the shared image client)
 
     Returns:
         Image URL if found, None otherwise
@@ -36,56 +157,88 @@ async def extract_og_image(url: str, timeout: float = 5.0) -> str | None:
     if not url:
         return None
 
-    try:
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(timeout),
-            follow_redirects=True,
-            verify=False,  # Some news sites have SSL issues
-        ) as client:
-            # Only fetch the head portion to save bandwidth
-            response = await client.get(
-                url,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (compatible; DeepNewsBot/1.0)",
-                    "Accept": "text/html",
-                }
-            )
+    cached = _og_image_cache.get(url)
+    if cached is not None:
+        return cached
+    if url in _og_image_miss_cache:
+        return None
+
+    image_url = await _fetch_og_image(client or _get_shared_client(), url, timeout)
+    if image_url:
+        _og_image_cache[url] = image_url
+    else:
+        _og_image_miss_cache[url] = True
+    return image_url
 
-            if response.status_code != 200:
+
+async def _fetch_og_image(client: httpx.AsyncClient, url: str, timeout: float) -> str | None:
+    """Fetch an article page and extract its og:image (uncached)."""
+    try:
+        # Only fetch the head portion to save bandwidth: ask for a byte range
+        # and stop reading once enough of the page is buffered
+        async with client.stream(
+            "GET",
+            url,
+            headers={
+                "Accept": "text/html",
+                "Range": f"bytes=0-{MAX_HTML_BYTES - 1}",
+            },
+            timeout=timeout,
+        ) as response:
+            if response.status_code not in (200, 206):
                 return None
 
-            # Only read first 50KB to find meta tags (they're usually in <head>)
-            html = response.text[:50000]
+            # Redirects to PDFs/images/binaries: bail before reading the body
+            content_type = response.headers.get("content-type", "")
+            if content_type and "html" not in content_type.lower():
+                return None
 
-            # Try og:image first
-            match = OG_IMAGE_PATTERN.search(html)
-            if match:
-                return match.group(1) or match.group(2)
+            buf = bytearray()
+            async for chunk in response.aiter_bytes():
+                buf.extend(chunk)
+                if len(buf) >= MAX_HTML_BYTES:
+                    break
 
-            # Fallback to twitter:image
-            match = TWITTER_IMAGE_PATTERN.search(html)
-            if match:
-                return match.group(1) or match.group(2)
+            # Only read first 50KB to find meta tags (they're usually in <head>)
+            html = buf[:MAX_HTML_BYTES].decode(
+                response.charset_encoding or "utf-8", errors="ignore"
+            )
 
-            return None
+        # og:image first, falling back to twitter:image
+        return _find_meta_image(html)
 
     except Exception as e:
         logger.debug(f"Failed to extract og:image from {url}: {e}")
         return None
 
 
+def _is_blocked_host(host: str) -> bool:
+    """Check a hostname (or any parent domain) against _BLOCKED_HOSTS."""
+    host = host.lower()
+    while host:
+        if host in _BLOCKED_HOSTS:
+            return True
+        _, _, host = host.partition(".")
+    return False
+
+
 async def extract_images_batch(
     articles: list[dict[str, Any]],
     max_images: int = 6,
     timeout: float = 3.0,
+    max_concurrency: int = 16,
 ) -> list[dict[str, Any]]:
     """
     Extract og:images from multiple articles in parallel.
 
+    Results are collected in completion order; remaining fetches are
+    cancelled as soon as max_images images have been found.
+
     Args:
         articles: List of article dicts with 'url', 'title', 'publisher', 'date' fields
         max_images: Maximum number of images to extract
         timeout: Timeout per request
+        max_concurrency: Maximum number of in-flight page fetches
 
     Returns:
         List of image dicts with 'url', 'title', 'publisher', 'date'
@@ -95,13 +248,22 @@ async def extract_images_batch(
 
     # Limit articles to check
     articles_to_check = articles[:max_images * 2]  # Check 2x to account for failures
+    client = _get_shared_client()
 
     async def fetch_image(article: dict) -> dict | None:
         url = article.get("url")
         if not url:
             return None
 
-        img_url = await extract_og_image(url, timeout=timeout)
+        # Cheap pre-filter before spending a fetch on the URL
+        parts = urlsplit(url)
+        path = parts.path.lower()
+        if path.endswith(_DIRECT_IMAGE_SUFFIXES):
+            img_url = url
+        elif _is_blocked_host(parts.hostname or "") or path.endswith(_NON_HTML_SUFFIXES):
+            return None
+        else:
+            img_url = await extract_og_image(url, timeout=timeout, client=client)
         if not img_url:
             return None
 
@@ -113,17 +275,32 @@ async def extract_images_batch(
             "article_url": url,
         }
 
-    # Run in parallel
-    tasks = [fetch_image(a) for a in articles_to_check]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # Bound in-flight requests to avoid connection errors and FD exhaustion
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def _guarded(article: dict) -> dict | None:
+        async with sem:
+            return await fetch_image(article)
+
+    # Run in parallel, keeping the first max_images that succeed
+    tasks = [asyncio.create_task(_guarded(a)) for a in articles_to_check]
 
-    # Filter successful results
     images = []
-    for result in results:
-        if isinstance(result, dict) and result.get("url"):
-            images.append(result)
-            if len(images) >= max_images:
-                break
+    try:
+        for fut in asyncio.as_completed(tasks):
+            try:
+                result = await fut
+            except Exception:
+                continue
+            if isinstance(result, dict) and result.get("url"):
+                images.append(result)
+                if len(images) >= max_images:
+                    break
+    finally:
+        # Cancel the stragglers once enough images are collected
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     return images
 
@@ -131,6 +308,106 @@ async def extract_images_batch(
 # BigKinds image extensions to try (in order of priority)
 BIGKINDS_IMAGE_EXTENSIONS = [".jpg", ".png", ".jpeg", ".gif", ".webp"]
 
+# Resolved extension per BigKinds image URL. The extension never changes for
+# a given image, so results are persisted to survive restarts.
+# Path: core/images.py -> core -> deep_news_oai -> src -> deep_news_oai (project root)
+BIGKINDS_EXT_CACHE_PATH = Path(__file__).parent.parent.parent.parent / "data" / "bigkinds_ext_cache.json"
+EXT_CACHE_FLUSH_DELAY = 5.0  # seconds; batches writes from a burst of lookups
+EXT_CACHE_SIZE = 20000  # entries; least recently used are dropped
+
+_ext_cache: LRUCache | None = None
+# Change counters: _ext_cache_version/_ext_cache_taken are only touched on the
+# event loop; _ext_cache_written is guarded by _ext_cache_write_lock
+_ext_cache_version = 0  # Bumped per recorded extension
+_ext_cache_taken = 0  # Version of the last snapshot handed to a writer
+_ext_cache_written = 0  # Version last written to disk
+_ext_cache_write_lock = threading.Lock()
+_ext_cache_flush_task: asyncio.Task | None = None
+
+
+def _load_ext_cache() -> LRUCache:
+    """Load the extension cache from disk on first use."""
+    global _ext_cache
+    if _ext_cache is None:
+        _ext_cache = LRUCache(maxsize=EXT_CACHE_SIZE)
+        try:
+            _ext_cache.update(json.loads(BIGKINDS_EXT_CACHE_PATH.read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load image extension cache: {e}")
+    return _ext_cache
+
+
+def _take_ext_cache_snapshot() -> tuple[int, dict[str, str]] | None:
+    """Copy the cache for writing if it changed since the last snapshot."""
+    global _ext_cache_taken
+    if _ext_cache is None or _ext_cache_version == _ext_cache_taken:
+        return None
+    _ext_cache_taken = _ext_cache_version
+    return _ext_cache_version, dict(_ext_cache)
+
+
+def _write_ext_cache(version: int, data: dict[str, str]) -> bool:
+    """Write a snapshot unless a newer one is already on disk (thread-safe)."""
+    global _ext_cache_written
+    with _ext_cache_write_lock:
+        if version <= _ext_cache_written:
+            return True
+        try:
+            BIGKINDS_EXT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = BIGKINDS_EXT_CACHE_PATH.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            tmp_path.replace(BIGKINDS_EXT_CACHE_PATH)
+        except OSError as e:
+            logger.warning(f"Failed to save image extension cache: {e}")
+            return False
+        _ext_cache_written = version
+        return True
+
+
+def _save_ext_cache() -> None:
+    """Write pending extension cache changes to disk now."""
+    global _ext_cache_taken
+    snapshot = _take_ext_cache_snapshot()
+    if snapshot and not _write_ext_cache(*snapshot):
+        _ext_cache_taken = _ext_cache_written  # Still unsaved
+
+
+async def _flush_ext_cache_later() -> None:
+    """Debounced background writes; repeats while lookups keep adding entries."""
+    global _ext_cache_taken
+    while True:
+        await asyncio.sleep(EXT_CACHE_FLUSH_DELAY)
+        # Copy on the loop so the thread never iterates a dict being mutated
+        snapshot = _take_ext_cache_snapshot()
+        if snapshot is None:
+            return
+        if not await asyncio.to_thread(_write_ext_cache, *snapshot):
+            _ext_cache_taken = _ext_cache_written  # Retried on the next change
+            return
+
+
+def _remember_ext(base_url: str, ext: str) -> None:
+    """Record a resolved extension and schedule a cache write."""
+    global _ext_cache_version, _ext_cache_flush_task
+    _load_ext_cache()[base_url] = ext
+    _ext_cache_version += 1
+    if _ext_cache_flush_task is None or _ext_cache_flush_task.done():
+        _ext_cache_flush_task = asyncio.create_task(_flush_ext_cache_later())
+
+
+async def _probe_image(client: httpx.AsyncClient, url: str, timeout: float) -> str | None:
+    """HEAD a candidate image URL; return it if it serves an image."""
+    try:
+        response = await client.head(url, timeout=timeout)
+    except Exception:
+        return None
+
+    if response.status_code == 200 and "image" in response.headers.get("content-type", ""):
+        return url
+    return None
+
 
 async def resolve_bigkinds_image_url(
     base_url: str,
@@ -140,8 +417,8 @@ async def resolve_bigkinds_image_url(
     Try different image extensions for BigKinds image URLs.
 
     BigKinds returns image URLs without extensions, but the actual images
-    require extensions like .jpg, .png, etc. This function tries each
-    extension and returns the first one that works.
+    require extensions like .jpg, .png, etc. This function probes every
+    extension concurrently and returns the first one that works.
 
     Args:
         base_url: BigKinds image URL (without extension)
@@ -157,21 +434,32 @@ async def resolve_bigkinds_image_url(
     if any(base_url.lower().endswith(ext) for ext in BIGKINDS_IMAGE_EXTENSIONS):
         return base_url
 
-    async with httpx.AsyncClient(
-        timeout=httpx.Timeout(timeout),
-        follow_redirects=True,
-    ) as client:
-        for ext in BIGKINDS_IMAGE_EXTENSIONS:
-            test_url = f"{base_url}{ext}"
-            try:
-                response = await client.head(test_url)
-                if response.status_code == 200:
-                    content_type = response.headers.get("content-type", "")
-                    if "image" in content_type:
-                        logger.debug(f"BigKinds image resolved: {test_url}")
-                        return test_url
-            except Exception:
-                continue
+    ext = _load_ext_cache().get(base_url)
+    if ext:
+        return f"{base_url}{ext}"
+
+    client = _get_shared_client()
+
+    # Probe all extensions at once and take the first one that serves an image
+    tasks = [
+        asyncio.create_task(_probe_image(client, f"{base_url}{ext}", timeout))
+        for ext in BIGKINDS_IMAGE_EXTENSIONS
+    ]
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            # Several probes may land together; keep extension priority among them
+            for task in sorted(done, key=tasks.index):
+                test_url = task.result()
+                if test_url:
+                    logger.debug(f"BigKinds image resolved: {test_url}")
+                    _remember_ext(base_url, BIGKINDS_IMAGE_EXTENSIONS[tasks.index(task)])
+                    return test_url
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
 
     logger.debug(f"Failed to resolve BigKinds image: {base_url}")
     return None
@@ -180,6 +468,8 @@ async def resolve_bigkinds_image_url(
 async def resolve_bigkinds_images_batch(
     image_urls: list[str],
     timeout: float = 2.0,
+    max_concurrency: int = 16,
+    limit: int | None = None,
 ) -> list[str]:
     """
     Resolve multiple BigKinds image URLs in parallel.
@@ -187,20 +477,56 @@ async def resolve_bigkinds_images_batch(
     Args:
         image_urls: List of BigKinds image URLs to resolve
         timeout: Timeout per request
+        max_concurrency: Maximum number of URLs resolved at once
+        limit: Stop once this many URLs have resolved (None waits for all)
 
     Returns:
-        List of resolved URLs (empty string for failed ones)
+        List of resolved URLs in input order (empty string for failed
+        ones, and for any still pending when the limit was reached)
     """
     if not image_urls:
         return []
 
-    tasks = [resolve_bigkinds_image_url(url, timeout) for url in image_urls]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    sem = asyncio.Semaphore(max_concurrency)
 
-    return [
-        result if isinstance(result, str) and result else ""
-        for result in results
-    ]
+    async def _guarded(url: str) -> str | None:
+        async with sem:
+            return await resolve_bigkinds_image_url(url, timeout)
+
+    if limit is None:
+        tasks = [_guarded(url) for url in image_urls]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        return [
+            result if isinstance(result, str) and result else ""
+            for result in results
+        ]
+
+    async def _indexed(i: int, url: str) -> tuple[int, str | None]:
+        return i, await _guarded(url)
+
+    resolved = [""] * len(image_urls)
+    tasks = [asyncio.create_task(_indexed(i, url)) for i, url in enumerate(image_urls)]
+
+    found = 0
+    try:
+        for fut in asyncio.as_completed(tasks):
+            try:
+                i, result = await fut
+            except Exception:
+                continue
+            if isinstance(result, str) and result:
+                resolved[i] = result
+                found += 1
+                if found >= limit:
+                    break
+    finally:
+        # Don't wait on slow probes once enough images have resolved
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return resolved
 
 
 def validate_image_url(url: str) -> bool:
@@ -218,15 +544,8 @@ def validate_image_url(url: str) -> bool:
 
     url_lower = url.lower()
 
-    # Must be http(s)
-    if not url_lower.startswith(('http://', 'https://')):
-        return False
-
-    # Check for common image extensions or image CDN patterns
-    image_patterns = [
-        '.jpg', '.jpeg', '.png', '.gif', '.webp',
-        '/image/', '/images/', '/img/', '/photo/',
-        'wimg.', 'img.', 'image.', 'cdn.',
-    ]
-
-    return any(pattern in url_lower for pattern in image_patterns)
+    # Must be http(s), with a common image extension or image CDN pattern
+    return (
+        url_lower.startswith(("http://", "https://"))
+        and _IMAGE_URL_PATTERN.search(url_lower) is not None
+    )
@@ -1,9 +1,9 @@
 """Data models for BigKinds news API."""
 
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class NewsArticle(BaseModel):
@@ -29,47 +29,72 @@ class NewsArticle(BaseModel):
 
     model_config = ConfigDict(extra="allow")
 
+    # Memoized to_structured()/to_full() dicts (articles aren't mutated after creation)
+    _structured_cache: dict | None = PrivateAttr(default=None)
+    _full_cache: dict | None = PrivateAttr(default=None)
+
+    # API keys for each field, in priority order (same semantics as the
+    # former `data.get(A) or data.get(B)` chains: first truthy value wins)
+    _FIELD_ALIASES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "news_id": ("NEWS_ID", "newsId"),
+        "title": ("TITLE", "title"),
+        "content": ("CONTENT", "content", "SUMMARY"),
+        "publisher": ("PROVIDER", "PUBLISHER", "publisher"),
+        "provider_code": ("PROVIDER_CODE", "providerCode"),
+        "category": ("CATEGORY", "category"),
+        "category_code": ("CATEGORY_CODE", "categoryCode"),
+        "news_date": ("NEWS_DATE", "DATE", "newsDate"),
+        "url": ("PROVIDER_LINK_PAGE", "URL", "url"),
+        "byline": ("BYLINE", "byline", "byLine"),
+        "analysis_flag": ("ANALYSIS_FLAG", "analysisFlag"),
+        "is_analysis": ("IS_ANALYSIS", "isAnalysis"),
+    }
+
     @classmethod
     def from_api_response(cls, data: dict) -> "NewsArticle":
-        """Create NewsArticle from API response data."""
-        mapped = {
-            "news_id": data.get("NEWS_ID") or data.get("newsId"),
-            "title": data.get("TITLE") or data.get("title", ""),
-            "content": data.get("CONTENT") or data.get("content") or data.get("SUMMARY"),
-            "publisher": data.get("PROVIDER") or data.get("PUBLISHER") or data.get("publisher"),
-            "provider_code": data.get("PROVIDER_CODE") or data.get("providerCode"),
-            "category": data.get("CATEGORY") or data.get("category"),
-            "category_code": data.get("CATEGORY_CODE") or data.get("categoryCode"),
-            "news_date": data.get("NEWS_DATE") or data.get("DATE") or data.get("newsDate"),
-            "url": data.get("PROVIDER_LINK_PAGE") or data.get("URL") or data.get("url"),
-            "byline": data.get("BYLINE") or data.get("byline") or data.get("byLine"),
-            "analysis_flag": data.get("ANALYSIS_FLAG") or data.get("analysisFlag"),
-            "is_analysis": data.get("IS_ANALYSIS") or data.get("isAnalysis"),
-            "raw_data": data,
-        }
-        return cls(**{k: v for k, v in mapped.items() if v is not None})
+        """
+        Create NewsArticle from API response data.
+
+        Skips pydantic validation (model_construct): the data comes straight
+        from the BigKinds API and is only re-serialized for responses.
+        """
+        mapped: dict[str, Any] = {"title": ""}
+        for field, keys in cls._FIELD_ALIASES.items():
+            value = None
+            for key in keys:
+                value = data.get(key)
+                if value:
+                    break
+            if value is not None:
+                mapped[field] = value
+
+        return cls.model_construct(**mapped, raw_data=data)
 
     def to_structured(self) -> dict:
-        """Convert to minimal structured format for OAI."""
-        return {
-            "news_id": self.news_id,
-            "title": self.title,
-            "publisher": self.publisher,
-            "date": self.news_date[:10] if self.news_date else None,
-        }
+        """Convert to minimal structured format for OAI (memoized)."""
+        if self._structured_cache is None:
+            self._structured_cache = {
+                "news_id": self.news_id,
+                "title": self.title,
+                "publisher": self.publisher,
+                "date": self.news_date[:10] if self.news_date else None,
+            }
+        return self._structured_cache
 
     def to_full(self) -> dict:
-        """Convert to full format for widget _meta."""
-        return {
-            "news_id": self.news_id,
-            "title": self.title,
-            "summary": self.content,
-            "publisher": self.publisher,
-            "category": self.category,
-            "published_date": self.news_date,
-            "url": self.url,
-            "author": self.byline,
-        }
+        """Convert to full format for widget _meta (memoized)."""
+        if self._full_cache is None:
+            self._full_cache = {
+                "news_id": self.news_id,
+                "title": self.title,
+                "summary": self.content,
+                "publisher": self.publisher,
+                "category": self.category,
+                "published_date": self.news_date,
+                "url": self.url,
+                "author": self.byline,
+            }
+        return self._full_cache
 
 
 class SearchRequest(BaseModel):
@@ -84,6 +109,7 @@ class SearchRequest(BaseModel):
 
     provider_codes: list[str] = Field(default_factory=list, description="Provider codes filter")
     category_codes: list[str] = Field(default_factory=list, description="Category codes filter")
+    news_ids: list[str] = Field(default_factory=list, description="Exact article IDs filter")
 
     search_scope_type: str = Field("1", description="Search scope type")
     search_filter_type: str = Field("1", description="Search filter type")
@@ -107,7 +133,7 @@ class SearchRequest(BaseModel):
             "mainTodayPersonYn": "",
             "startDate": self.start_date,
             "endDate": self.end_date,
-            "newsIds": [],
+            "newsIds": self.news_ids,
             "categoryCodes": self.category_codes,
             "providerCodes": self.provider_codes,
             "incidentCodes": [],
@@ -147,16 +173,21 @@ class SearchResponse(BaseModel):
     def from_api_response(
         cls, data: dict, request: SearchRequest, raw_response: dict | None = None
     ) -> "SearchResponse":
-        """Create SearchResponse from API response data."""
+        """
+        Create SearchResponse from API response data.
+
+        Like NewsArticle.from_api_response, skips pydantic validation;
+        the two scalar fields used in arithmetic are coerced explicitly.
+        """
         articles = []
         if data.get("resultList"):
             articles = [
                 NewsArticle.from_api_response(article_data) for article_data in data["resultList"]
             ]
 
-        return cls(
-            success=data.get("success", False),
-            total_count=data.get("totalCount", 0),
+        return cls.model_construct(
+            success=bool(data.get("success", False)),
+            total_count=int(data.get("totalCount") or 0),
             articles=articles,
             page_number=request.start_no,
             per_page=request.result_number,
@@ -6,15 +6,37 @@ with optional BigKinds news context integration.
 
 import csv
 import logging
+import pickle
+import re
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
+
+try:  # Optional: multithreaded CSV ingest for large trends caches
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
 
 logger = logging.getLogger(__name__)
 
+# Metadata lines in raw_text that are not related search terms
+_SKIP_RE = re.compile(r"만\+|arrow_|%|일 전|trending_|활성|외 |개")
+
+# Search volume marker in additional_info (e.g., "2만+", "5천+")
+_VOL_RE = re.compile(r"[만천]\+")
+
+# CSV columns used when parsing a row
+_CSV_COLUMNS = ("rank", "search_term", "raw_text", "additional_info", "scraped_at")
 
-@dataclass
+# Bump whenever TrendingItem or the parsing changes so old snapshots are ignored
+SNAPSHOT_VERSION = 1
+
+
+@dataclass(slots=True)
 class TrendingItem:
     """Single trending search item."""
 
@@ -63,16 +85,23 @@ class GoogleTrendsClient:
         """
         self.cache_path = Path(cache_path) if cache_path else self.DEFAULT_CACHE_PATH
         self.cache_max_age = timedelta(hours=cache_max_age_hours)
+        self._cache_max_age_sec: float = self.cache_max_age.total_seconds()
         self._cache: list[TrendingItem] | None = None
-        self._cache_loaded_at: datetime | None = None
+        self._cache_loaded_at: datetime | None = None  # Wall clock, for status only
+        self._cache_loaded_monotonic = float("-inf")
 
-    def _parse_csv_row(self, row: dict) -> TrendingItem | None:
-        """Parse a CSV row into TrendingItem."""
+    def _parse_csv_row(
+        self,
+        rank: str,
+        search_term: str,
+        raw_text: str,
+        additional_info: str,
+        scraped_at_raw: str,
+    ) -> TrendingItem | None:
+        """Parse the fields of a CSV row into TrendingItem."""
         try:
             # Parse related terms from raw_text if available
             related_terms = []
-            raw_text = row.get("raw_text", "")
-            additional_info = row.get("additional_info", "")
 
             # Extract related keywords from raw_text
             # Format: "keyword\nvolume\n...\nrelated1\nrelated2\n외 N개"
@@ -81,10 +110,10 @@ class GoogleTrendsClient:
                 for line in lines:
                     line = line.strip()
                     # Skip metadata lines
-                    if any(skip in line for skip in ["만+", "arrow_", "%", "일 전", "trending_", "활성", "외 ", "개"]):
+                    if _SKIP_RE.search(line):
                         continue
                     # Skip the main keyword
-                    if line == row.get("search_term", ""):
+                    if line == search_term:
                         continue
                     if line and len(line) > 1:
                         related_terms.append(line)
@@ -97,22 +126,22 @@ class GoogleTrendsClient:
                 parts = additional_info.split("\n")
                 for part in parts:
                     part = part.strip()
-                    if "만+" in part or "천+" in part:
+                    if _VOL_RE.search(part):
                         search_volume = part
                     elif "%" in part:
                         growth_rate = part
 
             # Parse scraped_at
             scraped_at = None
-            if row.get("scraped_at"):
+            if scraped_at_raw:
                 try:
-                    scraped_at = datetime.fromisoformat(row["scraped_at"])
+                    scraped_at = datetime.fromisoformat(scraped_at_raw)
                 except (ValueError, TypeError):
                     pass
 
             return TrendingItem(
-                rank=int(row.get("rank", 0)),
-                keyword=row.get("search_term", "").strip(),
+                rank=int(rank or 0),
+                keyword=search_term.strip(),
                 search_volume=search_volume,
                 growth_rate=growth_rate,
                 related_terms=related_terms[:10],  # Limit
@@ -122,24 +151,66 @@ class GoogleTrendsClient:
             logger.warning(f"Failed to parse CSV row: {e}")
             return None
 
+    def _read_rows(self) -> Iterable[list[str]]:
+        """Read the _CSV_COLUMNS fields of each CSV row with the csv module."""
+        with open(self.cache_path, "r", encoding="utf-8-sig", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+
+            # Resolve column positions once instead of building a dict per row
+            positions = {name: i for i, name in enumerate(header)}
+            indices = [positions.get(name) for name in _CSV_COLUMNS]
+
+            for row in reader:
+                row_len = len(row)
+                yield [row[i] if i is not None and i < row_len else "" for i in indices]
+
+    def _read_rows_arrow(self) -> Iterable[tuple[str, ...]]:
+        """Read the _CSV_COLUMNS fields of each CSV row with pyarrow."""
+        table = pa_csv.read_csv(
+            self.cache_path,
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in _CSV_COLUMNS},
+                include_columns=list(_CSV_COLUMNS),
+                include_missing_columns=True,
+            ),
+        )
+
+        # Drop rows without a search term before materializing Python objects
+        terms = pc.fill_null(table.column("search_term"), "")
+        table = table.filter(pc.not_equal(pc.utf8_trim_whitespace(terms), ""))
+
+        columns = [
+            [value or "" for value in table.column(name).to_pylist()]
+            for name in _CSV_COLUMNS
+        ]
+        return zip(*columns)
+
     def _load_cache(self) -> list[TrendingItem]:
-        """Load trending data from CSV cache."""
+        """Load trending data from CSV cache (sorted by rank)."""
         if not self.cache_path.exists():
             logger.warning(f"Cache file not found: {self.cache_path}")
             return []
 
-        items = []
         try:
-            with open(self.cache_path, "r", encoding="utf-8-sig") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    item = self._parse_csv_row(row)
+            items = self._load_snapshot()
+            if items is None:
+                items = []
+                rows = self._read_rows_arrow() if pa is not None else self._read_rows()
+                for fields in rows:
+                    item = self._parse_csv_row(*fields)
                     if item and item.keyword:
                         items.append(item)
 
+                # Sort once here so get_trending is a plain slice
+                items.sort(key=lambda x: x.rank)
+                self._save_snapshot(items)
+
             logger.info(f"Loaded {len(items)} trending items from cache")
             self._cache = items
             self._cache_loaded_at = datetime.now()
+            self._cache_loaded_monotonic = time.monotonic()
 
         except Exception as e:
             logger.error(f"Failed to load cache: {e}")
@@ -147,11 +218,44 @@ class GoogleTrendsClient:
 
         return items
 
+    @property
+    def snapshot_path(self) -> Path:
+        """Pickled snapshot of the parsed CSV, stored next to it."""
+        return self.cache_path.with_suffix(".pkl")
+
+    def _load_snapshot(self) -> list[TrendingItem] | None:
+        """Load parsed items from the snapshot if it is newer than the CSV."""
+        try:
+            if self.snapshot_path.stat().st_mtime < self.cache_path.stat().st_mtime:
+                return None
+            with open(self.snapshot_path, "rb") as f:
+                version, items = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable trends snapshot: {e}")
+            return None
+
+        if version != SNAPSHOT_VERSION or not isinstance(items, list):
+            return None
+        return items
+
+    def _save_snapshot(self, items: list[TrendingItem]) -> None:
+        """Write parsed items to the snapshot (best effort)."""
+        tmp_path = self.snapshot_path.with_suffix(".pkl.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump((SNAPSHOT_VERSION, items), f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(self.snapshot_path)
+        except Exception as e:
+            logger.warning(f"Failed to write trends snapshot: {e}")
+
     def _is_cache_valid(self) -> bool:
-        """Check if cache is still valid."""
-        if self._cache is None or self._cache_loaded_at is None:
-            return False
-        return datetime.now() - self._cache_loaded_at < self.cache_max_age
+        """Check if cache is still valid (monotonic clock, immune to wall-clock jumps)."""
+        return (
+            self._cache is not None
+            and time.monotonic() - self._cache_loaded_monotonic < self._cache_max_age_sec
+        )
 
     def get_trending(self, limit: int = 20) -> list[TrendingItem]:
         """
@@ -170,9 +274,8 @@ class GoogleTrendsClient:
         if not self._cache:
             return []
 
-        # Sort by rank and limit
-        sorted_items = sorted(self._cache, key=lambda x: x.rank)
-        return sorted_items[:limit]
+        # Cache is already sorted by rank
+        return self._cache[:limit]
 
     def get_trending_with_context(
         self,
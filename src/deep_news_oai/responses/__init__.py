@@ -1,5 +1,5 @@
 """OAI response builders."""
 
-from deep_news_oai.responses.builder import OAIResponse
+from deep_news_oai.responses.builder import OAIResponse, OAIResult
 
-__all__ = ["OAIResponse"]
+__all__ = ["OAIResponse", "OAIResult"]
@@ -6,12 +6,12 @@ Builds the "3형제" response format:
 - _meta: Widget-only data (not exposed to model)
 """
 
-from typing import Any
+from typing import Any, TypedDict
 
 
 # Widget CSP: Allowed domains for external resources
 # Korean news publishers for images, plus common CDNs
-WIDGET_CSP_DOMAINS = [
+WIDGET_CSP_DOMAINS = (
     "*.bigkinds.or.kr",
     "*.chosun.com",
     "*.donga.com",
@@ -24,7 +24,37 @@ WIDGET_CSP_DOMAINS = [
     "*.sbs.co.kr",
     "*.mbc.co.kr",
     "*.yna.co.kr",
-]
+)
+
+# Shared _meta for inline responses. A plain dict, not MappingProxyType:
+# FastMCP's pydantic serializer rejects mappingproxy in tool results.
+# Never mutate it; callers that need _meta fields use success().
+_EMPTY_META: dict[str, Any] = {}
+
+# Template URIs for the widgets registered in server.py
+_WIDGET_URI = {
+    name: f"widget://{name}"
+    for name in (
+        "search_results",
+        "article_detail",
+        "report",
+        "perspectives",
+        "timeline",
+        "trending_issues",
+    )
+}
+
+
+class OAIResult(TypedDict):
+    """Shape of every response built here.
+
+    A TypedDict rather than a slots dataclass: FastMCP validates tool
+    results as plain dicts, so the value must stay a dict at runtime.
+    """
+
+    structuredContent: dict[str, Any]
+    content: str
+    _meta: dict[str, Any]
 
 
 class OAIResponse:
@@ -37,7 +67,7 @@ class OAIResponse:
         full_data: dict[str, Any] | None = None,
         widget: str | None = None,
         extra_meta: dict[str, Any] | None = None,
-    ) -> dict[str, Any]:
+    ) -> OAIResult:
         """
         Build a success response in OAI 3형제 format.
 
@@ -54,7 +84,7 @@ class OAIResponse:
         meta: dict[str, Any] = {}
 
         if widget:
-            meta["openai/outputTemplate"] = f"widget://{widget}"
+            meta["openai/outputTemplate"] = _WIDGET_URI.get(widget) or f"widget://{widget}"
             # Add CSP for widget security - allows external images from news sites
             meta["openai/widgetCSP"] = WIDGET_CSP_DOMAINS
 
@@ -75,7 +105,7 @@ class OAIResponse:
         code: str,
         message: str,
         details: dict[str, Any] | None = None,
-    ) -> dict[str, Any]:
+    ) -> OAIResult:
         """
         Build an error response in OAI 3형제 format.
 
@@ -108,7 +138,7 @@ class OAIResponse:
     def inline(
         structured: dict[str, Any],
         content: str,
-    ) -> dict[str, Any]:
+    ) -> OAIResult:
         """
         Build an inline response (no widget, just text).
 
@@ -124,11 +154,21 @@ class OAIResponse:
         return {
             "structuredContent": structured,
             "content": content,
-            "_meta": {},
+            "_meta": _EMPTY_META,
         }
 
 
 # Convenience functions for common response patterns
+#
+# Timeline and publisher entries are built by the analysis tools in
+# server.py and always carry "date"/"name" and "count", so they are
+# indexed directly rather than through .get().
+
+
+def _top(items: list[dict], n: int) -> list[dict]:
+    """Project the first n publisher entries down to name and count."""
+    return [{"name": x["name"], "count": x["count"]} for x in items[:n]]
+
 
 def search_response(
     total_count: int,
@@ -136,19 +176,28 @@ def search_response(
     page_size: int,
     articles: list[dict],
     keyword: str,
-) -> dict[str, Any]:
-    """Build search results response."""
+    top_articles: list[dict] | None = None,
+) -> OAIResult:
+    """
+    Build search results response.
+
+    top_articles can be passed pre-built by callers that already have the
+    preview fields; otherwise it is taken from the first 5 articles.
+    """
     has_next = total_count > page * page_size
 
+    if top_articles is None:
+        top_articles = [
+            {"title": a.get("title"), "publisher": a.get("publisher"), "date": a.get("date")}
+            for a in articles[:5]  # Only top 5 for model
+        ]
+
     # Structured: minimal for model
     structured = {
         "total_count": total_count,
         "page": page,
         "has_next": has_next,
-        "top_articles": [
-            {"title": a.get("title"), "publisher": a.get("publisher"), "date": a.get("date")}
-            for a in articles[:5]  # Only top 5 for model
-        ],
+        "top_articles": top_articles,
     }
 
     # Content: readable summary
@@ -173,7 +222,7 @@ def article_response(
     url: str | None = None,
     author: str | None = None,
     images: list[str] | None = None,
-) -> dict[str, Any]:
+) -> OAIResult:
     """Build article detail response."""
     structured = {
         "news_id": news_id,
@@ -212,25 +261,27 @@ def report_response(
     key_events: list[dict],
     images: list[dict],
     extra_meta: dict[str, Any] | None = None,
-) -> dict[str, Any]:
+) -> OAIResult:
     """Build comprehensive analysis report response."""
+    period = f"{start_date} ~ {end_date}"
+    total_articles = summary.get("total_articles", 0)
+    publisher_count = summary.get("publisher_count", 0)
+    peak_date = summary.get("peak_date")
+    peak_count = summary.get("peak_count", 0)
+
     structured = {
         "keyword": keyword,
-        "period": f"{start_date} ~ {end_date}",
-        "total_articles": summary.get("total_articles", 0),
-        "publisher_count": summary.get("publisher_count", 0),
-        "peak_date": summary.get("peak_date"),
-        "peak_count": summary.get("peak_count", 0),
-        "top_publishers": [
-            {"name": p.get("name"), "count": p.get("count")}
-            for p in publishers[:3]
-        ],
+        "period": period,
+        "total_articles": total_articles,
+        "publisher_count": publisher_count,
+        "peak_date": peak_date,
+        "peak_count": peak_count,
+        "top_publishers": _top(publishers, 3),
     }
 
-    content = f"'{keyword}' 심층 분석 리포트: {start_date} ~ {end_date}"
-    content += f"\n총 {summary.get('total_articles', 0):,}건, {summary.get('publisher_count', 0)}개 언론사"
-    if summary.get("peak_date"):
-        content += f"\n피크: {summary.get('peak_date')} ({summary.get('peak_count', 0)}건)"
+    content = f"'{keyword}' 심층 분석 리포트: {period}\n총 {total_articles:,}건, {publisher_count}개 언론사"
+    if peak_date:
+        content += f"\n피크: {peak_date} ({peak_count}건)"
 
     return OAIResponse.success(
         structured=structured,
@@ -257,23 +308,21 @@ def perspectives_response(
     publishers: list[dict],
     total_articles: int,
     extra_meta: dict[str, Any] | None = None,
-) -> dict[str, Any]:
+) -> OAIResult:
     """Build publisher perspectives comparison response."""
+    publisher_count = len(publishers)
     structured = {
         "keyword": keyword,
         "period": f"{start_date} ~ {end_date}",
         "total_articles": total_articles,
-        "publisher_count": len(publishers),
-        "top_publishers": [
-            {"name": p.get("name"), "count": p.get("count")}
-            for p in publishers[:5]
-        ],
+        "publisher_count": publisher_count,
+        "top_publishers": _top(publishers, 5),
     }
 
-    content = f"'{keyword}' 언론사별 보도 비교: {len(publishers)}개 언론사, 총 {total_articles:,}건"
+    content = f"'{keyword}' 언론사별 보도 비교: {publisher_count}개 언론사, 총 {total_articles:,}건"
     if publishers:
         top = publishers[0]
-        content += f" (최다: {top.get('name')} {top.get('count')}건)"
+        content += f" (최다: {top['name']} {top['count']}건)"
 
     return OAIResponse.success(
         structured=structured,
@@ -297,21 +346,28 @@ def timeline_response(
     timeline: list[dict],
     total_articles: int,
     extra_meta: dict[str, Any] | None = None,
-) -> dict[str, Any]:
+) -> OAIResult:
     """Build timeline analysis response."""
+    # Single pass; ties keep the earliest entry, matching max()
+    peak_date, peak_count = None, 0
+    for i, t in enumerate(timeline):
+        count = t["count"]
+        if i == 0 or count > peak_count:
+            peak_date, peak_count = t["date"], count
+
+    period = f"{start_date} ~ {end_date}"
     structured = {
         "keyword": keyword,
-        "period": f"{start_date} ~ {end_date}",
+        "period": period,
         "total_articles": total_articles,
         "data_points": len(timeline),
-        "peak_date": max(timeline, key=lambda x: x.get("count", 0)).get("date") if timeline else None,
-        "peak_count": max(t.get("count", 0) for t in timeline) if timeline else 0,
+        "peak_date": peak_date,
+        "peak_count": peak_count,
     }
 
-    content = f"'{keyword}' 타임라인 분석: {start_date} ~ {end_date}, 총 {total_articles:,}건"
+    content = f"'{keyword}' 타임라인 분석: {period}, 총 {total_articles:,}건"
     if timeline:
-        peak = max(timeline, key=lambda x: x.get("count", 0))
-        content += f" (피크: {peak.get('date')} {peak.get('count')}건)"
+        content += f" (피크: {peak_date} {peak_count}건)"
 
     return OAIResponse.success(
         structured=structured,
@@ -332,7 +388,7 @@ def trending_response(
     issues: list[dict],
     date: str,
     extra_meta: dict[str, Any] | None = None,
-) -> dict[str, Any]:
+) -> OAIResult:
     """Build trending issues response."""
     structured = {
         "date": date,
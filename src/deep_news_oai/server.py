@@ -1,15 +1,35 @@
 """FastMCP server for Deep News OAI - OpenAI ChatGPT App."""
 
+import asyncio
+import inspect
 import logging
+import os
+import time
+from collections import Counter, OrderedDict, defaultdict
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator
-
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache, partial, wraps
+from heapq import nlargest
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, AsyncIterator, Final
+
+import orjson
+from cachetools import TTLCache
 from mcp.server.fastmcp import FastMCP
 
 from deep_news_oai.core.client import BigKindsClient
+from deep_news_oai.core.models import NewsArticle, SearchRequest, SearchResponse
 from deep_news_oai.core.trends import GoogleTrendsClient
-from deep_news_oai.core.images import resolve_bigkinds_images_batch
+from deep_news_oai.core.images import close_shared_client, resolve_bigkinds_images_batch
 from deep_news_oai.responses.builder import OAIResponse, search_response, article_response, trending_response, timeline_response, perspectives_response, report_response
+from deep_news_oai.widgets.loader import (
+    load_widget,
+    load_widget_bytes,
+    load_widget_gzip,
+    widget_etag,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,24 +47,153 @@ mcp = FastMCP("deep-news-oai", transport_security=transport_security)
 _client: BigKindsClient | None = None
 _trends_client: GoogleTrendsClient | None = None
 
+# Fast-fail responses shared by every tool (never mutated downstream)
+_ERR_NO_CLIENT: Final = OAIResponse.error("SERVER_ERROR", "서버가 초기화되지 않았습니다.")
+_ERR_NO_TRENDS: Final = OAIResponse.error("SERVER_ERROR", "트렌드 클라이언트가 초기화되지 않았습니다.")
+
+# Sort key for timeline/publisher/event entries
+_count_key = itemgetter("count")
+
+# raw_data keys that may hold an article image, in priority order
+_IMAGE_KEYS: Final = ("IMAGES", "images", "IMAGE_URL", "imageUrl", "THUMBNAIL", "thumbnail")
+
+# Single-flight search cache: request key -> (created_at, fetch task)
+SEARCH_CACHE_TTL = 300.0
+SEARCH_CACHE_SIZE = 64
+_search_cache: OrderedDict[str, tuple[float, asyncio.Task]] = OrderedDict()
+
+
+async def _cached_search(request: SearchRequest) -> SearchResponse:
+    """
+    Search through a short-lived shared cache.
+
+    Concurrent callers with the same request await one in-flight BigKinds
+    call, and repeats within SEARCH_CACHE_TTL reuse its response.
+    Unsuccessful responses and errors are not kept.
+    """
+    key = request.model_dump_json()
+    loop = asyncio.get_running_loop()
+    now = loop.time()
+
+    entry = _search_cache.get(key)
+    if entry and now - entry[0] < SEARCH_CACHE_TTL:
+        _search_cache.move_to_end(key)
+        task = entry[1]
+    else:
+        # The fetch runs in its own task so no single caller owns it
+        task = loop.create_task(_client.search(request))
+        task.add_done_callback(partial(_on_search_done, key))
+        _search_cache[key] = (now, task)
+        _search_cache.move_to_end(key)
+        while len(_search_cache) > SEARCH_CACHE_SIZE:
+            _search_cache.popitem(last=False)
+
+    # Shield so a cancelled caller doesn't cancel the shared fetch
+    return await asyncio.shield(task)
+
+
+def _on_search_done(key: str, task: asyncio.Task) -> None:
+    """Drop a finished fetch from the cache unless it succeeded."""
+    # exception() also marks the error retrieved when nobody is waiting
+    if task.cancelled() or task.exception() is not None or not task.result().success:
+        _drop_search_entry(key, task)
+
+
+def _drop_search_entry(key: str, task: asyncio.Task) -> None:
+    """Remove a search cache entry if it still belongs to this fetch."""
+    entry = _search_cache.get(key)
+    if entry and entry[1] is task:
+        del _search_cache[key]
+
+
+# Analysis tool result cache: (tool, *args) -> OAI result. Expected
+# "no articles"/bad-input errors are kept briefly; other errors are not.
+TOOL_CACHE_TTL = 180.0
+TOOL_CACHE_SIZE = 128
+TOOL_ERROR_CACHE_TTL = 30.0
+_CACHEABLE_ERRORS: Final = frozenset({"NO_DATA", "INVALID_DATE", "INVALID_RANGE"})
+_tool_cache: TTLCache = TTLCache(maxsize=TOOL_CACHE_SIZE, ttl=TOOL_CACHE_TTL)
+_tool_error_cache: TTLCache = TTLCache(maxsize=TOOL_CACHE_SIZE, ttl=TOOL_ERROR_CACHE_TTL)
+_tool_locks: dict[tuple, list] = {}  # key -> [asyncio.Lock, user count]
+
+
+def _async_ttl_cache(fn):
+    """
+    Cache an async tool's results per bound argument tuple.
+
+    A per-key lock makes concurrent identical calls wait for the first
+    one instead of all recomputing. Results are shared dicts and must
+    not be mutated by callers.
+    """
+    sig = inspect.signature(fn)
+
+    @wraps(fn)
+    async def wrapper(*args, **kwargs):
+        bound = sig.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (fn.__name__, *bound.arguments.values())
+
+        # [lock, users]: dropped only when no caller holds or awaits it
+        entry = _tool_locks.get(key)
+        if entry is None:
+            entry = _tool_locks[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                result = _tool_cache.get(key) or _tool_error_cache.get(key)
+                if result is None:
+                    result = await fn(*args, **kwargs)
+                    structured = result["structuredContent"]
+                    if not structured.get("error"):
+                        _tool_cache[key] = result
+                    elif structured["code"] in _CACHEABLE_ERRORS:
+                        _tool_error_cache[key] = result
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del _tool_locks[key]
+        return result
+
+    return wrapper
+
+
+def _article_date(article: NewsArticle) -> str | None:
+    """YYYY-MM-DD part of an article's date, or None if it has none."""
+    return article.news_date[:10] if article.news_date else None
+
+
+@lru_cache(maxsize=512)
+def _week_start(article_date: str) -> str:
+    """Monday of the week containing a YYYY-MM-DD date, as YYYY-MM-DD."""
+    day = date(int(article_date[0:4]), int(article_date[5:7]), int(article_date[8:10]))
+    return date.fromordinal(day.toordinal() - day.weekday()).isoformat()
+
 
 @asynccontextmanager
-async def lifespan(app: FastMCP) -> AsyncIterator[dict[str, Any]]:
-    """Server lifecycle management."""
+async def lifespan(app: "Starlette") -> AsyncIterator[None]:
+    """
+    Process lifecycle management, run by the Starlette app.
+
+    FastMCP's own lifespan runs once per MCP session, which would close
+    the shared clients whenever any one client disconnected.
+    """
     global _client, _trends_client
 
     logger.info("Starting Deep News OAI server...")
     _client = BigKindsClient()
     _trends_client = GoogleTrendsClient()
 
-    yield {"client": _client, "trends": _trends_client}
+    yield
 
     logger.info("Shutting down Deep News OAI server...")
     if _client:
         await _client.close()
-
-
-mcp.settings.lifespan = lifespan
+    await close_shared_client()
+    for _, task in _search_cache.values():
+        task.cancel()
+    _search_cache.clear()
+    _tool_cache.clear()
+    _tool_error_cache.clear()
 
 
 # =============================================================================
@@ -90,9 +239,7 @@ async def search_korean_news(
         Search results with articles in OAI format
     """
     if not _client:
-        return OAIResponse.error("SERVER_ERROR", "서버가 초기화되지 않았습니다.")
-
-    from deep_news_oai.core.models import SearchRequest
+        return _ERR_NO_CLIENT
 
     try:
         request = SearchRequest(
@@ -110,13 +257,22 @@ async def search_korean_news(
                 response.error_message or "검색에 실패했습니다.",
             )
 
-        articles = [a.to_full() for a in response.articles]
+        # Preview comes from the small memoized structured dicts, which also
+        # carry the date that to_full() lacks
+        top_articles = []
+        for a in response.articles[:5]:
+            preview = a.to_structured()
+            top_articles.append(
+                {"title": preview["title"], "publisher": preview["publisher"], "date": preview["date"]}
+            )
+
         return search_response(
             total_count=response.total_count,
             page=page,
             page_size=page_size,
-            articles=articles,
+            articles=[a.to_full() for a in response.articles],
             keyword=keyword,
+            top_articles=top_articles,
         )
 
     except Exception as e:
@@ -151,9 +307,7 @@ async def get_article_detail(
         Article detail with title, content, publisher, date, and URL in OAI format
     """
     if not _client:
-        return OAIResponse.error("SERVER_ERROR", "서버가 초기화되지 않았습니다.")
-
-    from deep_news_oai.core.models import SearchRequest
+        return _ERR_NO_CLIENT
 
     try:
         # Extract provider_code and date from news_id
@@ -169,23 +323,31 @@ async def get_article_detail(
         date_str = parts[1][:8]  # YYYYMMDD
         search_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
 
-        # Search by provider_code on the specific date
+        # Ask BigKinds for the exact article first (newsIds filter)
         request = SearchRequest(
-            keyword="",  # Empty keyword to get all articles
+            keyword="",
             start_date=search_date,
             end_date=search_date,
             start_no=1,
-            result_number=200,  # Get more to find the article
+            result_number=1,
             provider_codes=[provider_code],
+            news_ids=[news_id],
         )
         response = await _client.search(request)
+        article = {a.news_id: a for a in response.articles}.get(news_id)
 
-        # Find the exact article by news_id
-        article = None
-        for a in response.articles:
-            if a.news_id == news_id:
-                article = a
-                break
+        if not article:
+            # Fall back to scanning the provider's articles on that date
+            request = SearchRequest(
+                keyword="",  # Empty keyword to get all articles
+                start_date=search_date,
+                end_date=search_date,
+                start_no=1,
+                result_number=200,  # Get more to find the article
+                provider_codes=[provider_code],
+            )
+            response = await _client.search(request)
+            article = {a.news_id: a for a in response.articles}.get(news_id)
 
         if not article:
             return OAIResponse.error(
@@ -193,16 +355,15 @@ async def get_article_detail(
                 f"기사를 찾을 수 없습니다: {news_id}",
             )
 
-        # Extract image URL if available
+        # Extract image URLs if available (IMAGES may hold several, comma-separated)
         images = []
         if article.raw_data:
-            img_url = article.raw_data.get("IMAGES")
-            if img_url:
-                # Resolve with extension fallback
-                from deep_news_oai.core.images import resolve_bigkinds_image_url
-                resolved_url = await resolve_bigkinds_image_url(img_url)
-                if resolved_url:
-                    images.append(resolved_url)
+            img_field = article.raw_data.get("IMAGES") or ""
+            img_urls = [u.strip() for u in img_field.split(",") if u.strip()]
+            if img_urls:
+                # Resolve with extension fallback (parallel)
+                resolved_urls = await resolve_bigkinds_images_batch(img_urls)
+                images = [url for url in resolved_urls if url]
 
         return article_response(
             news_id=article.news_id or news_id,
@@ -250,7 +411,7 @@ async def count_news_articles(
         Article count in OAI format
     """
     if not _client:
-        return OAIResponse.error("SERVER_ERROR", "서버가 초기화되지 않았습니다.")
+        return _ERR_NO_CLIENT
 
     try:
         count = await _client.get_total_count(keyword, start_date, end_date)
@@ -269,6 +430,40 @@ async def count_news_articles(
 # TOOLS: Utils
 # =============================================================================
 
+_KST: Final = timezone(timedelta(hours=9))
+
+# (epoch second, response) of the last get_korean_time call
+_korean_time_cache: tuple[int, dict[str, Any] | None] = (-1, None)
+
+# Major Korean news providers
+_PROVIDERS: Final = {
+    "전국일간지": ("경향신문", "국민일보", "동아일보", "문화일보", "서울신문", "세계일보", "조선일보", "중앙일보", "한겨레", "한국일보"),
+    "경제지": ("매일경제", "머니투데이", "서울경제", "아시아경제", "이데일리", "조선비즈", "파이낸셜뉴스", "한국경제"),
+    "방송사": ("KBS", "MBC", "SBS", "JTBC", "채널A", "TV조선", "MBN", "YTN"),
+    "통신사": ("연합뉴스", "뉴시스", "뉴스1"),
+}
+_PROVIDER_TOTAL: Final = sum(len(v) for v in _PROVIDERS.values())
+_PROVIDER_GROUPS: Final = tuple(_PROVIDERS)
+_PROVIDERS_CONTENT: Final = (
+    f"총 {_PROVIDER_TOTAL}개 언론사가 등록되어 있습니다. "
+    f"주요 언론사: {', '.join(_PROVIDERS['전국일간지'][:5])}..."
+)
+
+# BigKinds category codes
+_CATEGORIES: Final = {
+    "정치": "001000000",
+    "경제": "002000000",
+    "사회": "003000000",
+    "문화": "004000000",
+    "국제": "005000000",
+    "지역": "006000000",
+    "스포츠": "007000000",
+    "IT_과학": "008000000",
+}
+_CATEGORY_INDEX: Final = {name.lower(): (name, code) for name, code in _CATEGORIES.items()}
+_CATEGORY_NAMES: Final = ", ".join(_CATEGORIES)
+
+
 @mcp.tool(
     annotations={
         "title": "Get Korean Time",
@@ -287,12 +482,15 @@ async def get_korean_time() -> dict[str, Any]:
     Returns:
         Current Korean time in OAI format
     """
-    from datetime import datetime, timezone, timedelta
+    global _korean_time_cache
 
-    kst = timezone(timedelta(hours=9))
-    now = datetime.now(kst)
+    # Coalesce bursts of calls within the same second
+    sec = int(time.time())
+    if _korean_time_cache[0] == sec:
+        return _korean_time_cache[1]
 
-    return OAIResponse.inline(
+    now = datetime.now(_KST)
+    result = OAIResponse.inline(
         structured={
             "datetime": now.isoformat(),
             "date": now.strftime("%Y-%m-%d"),
@@ -301,6 +499,8 @@ async def get_korean_time() -> dict[str, Any]:
         },
         content=f"현재 한국 시간: {now.strftime('%Y년 %m월 %d일 %H시 %M분')}",
     )
+    _korean_time_cache = (sec, result)
+    return result
 
 
 @mcp.tool(
@@ -323,19 +523,9 @@ async def list_news_providers() -> dict[str, Any]:
     Returns:
         List of news providers in OAI format
     """
-    # Major Korean news providers
-    providers = {
-        "전국일간지": ["경향신문", "국민일보", "동아일보", "문화일보", "서울신문", "세계일보", "조선일보", "중앙일보", "한겨레", "한국일보"],
-        "경제지": ["매일경제", "머니투데이", "서울경제", "아시아경제", "이데일리", "조선비즈", "파이낸셜뉴스", "한국경제"],
-        "방송사": ["KBS", "MBC", "SBS", "JTBC", "채널A", "TV조선", "MBN", "YTN"],
-        "통신사": ["연합뉴스", "뉴시스", "뉴스1"],
-    }
-
-    total_count = sum(len(v) for v in providers.values())
-
     return OAIResponse.inline(
-        structured={"provider_count": total_count, "categories": list(providers.keys())},
-        content=f"총 {total_count}개 언론사가 등록되어 있습니다. 주요 언론사: {', '.join(providers['전국일간지'][:5])}...",
+        structured={"provider_count": _PROVIDER_TOTAL, "categories": list(_PROVIDER_GROUPS)},
+        content=_PROVIDERS_CONTENT,
     )
 
 
@@ -362,23 +552,18 @@ async def find_news_category(query: str) -> dict[str, Any]:
     Returns:
         Matching categories/providers in OAI format
     """
-    categories = {
-        "정치": "001000000",
-        "경제": "002000000",
-        "사회": "003000000",
-        "문화": "004000000",
-        "국제": "005000000",
-        "지역": "006000000",
-        "스포츠": "007000000",
-        "IT_과학": "008000000",
-    }
-
     query_lower = query.lower()
-    matches = []
 
-    for name, code in categories.items():
-        if query_lower in name.lower():
-            matches.append({"name": name, "code": code, "type": "category"})
+    # Exact name first, then substring scan
+    exact = _CATEGORY_INDEX.get(query_lower)
+    if exact:
+        matches = [{"name": exact[0], "code": exact[1], "type": "category"}]
+    else:
+        matches = [
+            {"name": name, "code": code, "type": "category"}
+            for key, (name, code) in _CATEGORY_INDEX.items()
+            if query_lower in key
+        ]
 
     if matches:
         return OAIResponse.inline(
@@ -388,7 +573,7 @@ async def find_news_category(query: str) -> dict[str, Any]:
     else:
         return OAIResponse.inline(
             structured={"query": query, "matches": []},
-            content=f"'{query}'에 해당하는 카테고리를 찾을 수 없습니다. 가능한 카테고리: {', '.join(categories.keys())}",
+            content=f"'{query}'에 해당하는 카테고리를 찾을 수 없습니다. 가능한 카테고리: {_CATEGORY_NAMES}",
         )
 
 
@@ -426,7 +611,7 @@ async def get_trending_now(limit: int = 10) -> dict[str, Any]:
         Trending keywords with search volume and related terms in OAI format
     """
     if not _trends_client:
-        return OAIResponse.error("SERVER_ERROR", "트렌드 클라이언트가 초기화되지 않았습니다.")
+        return _ERR_NO_TRENDS
 
     try:
         # Get trending items
@@ -453,9 +638,7 @@ async def get_trending_now(limit: int = 10) -> dict[str, Any]:
         cache_status = _trends_client.get_cache_status()
         scraped_at = trending_items[0].scraped_at if trending_items else None
 
-        from datetime import datetime, timezone, timedelta
-        kst = timezone(timedelta(hours=9))
-        now = datetime.now(kst)
+        now = datetime.now(_KST)
         date_str = now.strftime("%Y-%m-%d")
 
         return trending_response(
@@ -496,7 +679,7 @@ async def refresh_trends_cache(data_path: str) -> dict[str, Any]:
         Cache refresh status in OAI format
     """
     if not _trends_client:
-        return OAIResponse.error("SERVER_ERROR", "트렌드 클라이언트가 초기화되지 않았습니다.")
+        return _ERR_NO_TRENDS
 
     try:
         success = _trends_client.refresh_cache(data_path)
@@ -522,6 +705,286 @@ async def refresh_trends_cache(data_path: str) -> dict[str, Any]:
 # TOOLS: Analysis
 # =============================================================================
 
+# Shared article set for the analysis tools (one BigKinds call per keyword/period)
+ANALYSIS_RESULT_NUMBER = 1000
+
+
+@dataclass(slots=True)
+class _AnalysisBundle:
+    """Articles fetched for analysis, grouped in a single pass."""
+
+    response: SearchResponse
+    date_groups: dict[str, list] = field(default_factory=dict)  # YYYY-MM-DD -> articles, ascending
+    publisher_groups: dict[str, list] = field(default_factory=dict)
+    raw_image_data: list[dict] = field(default_factory=list)  # Up to 12 image candidates
+
+
+async def _analyze_bundle(keyword: str, start_date: str, end_date: str) -> _AnalysisBundle:
+    """
+    Fetch (or reuse) the analysis article set and group it once.
+
+    Concurrent and repeated calls share one BigKinds request through
+    _cached_search; the groups are only built for successful responses.
+    """
+    request = SearchRequest(
+        keyword=keyword,
+        start_date=start_date,
+        end_date=end_date,
+        start_no=1,
+        result_number=ANALYSIS_RESULT_NUMBER,
+        sort_method="date",
+    )
+    response = await _cached_search(request)
+    bundle = _AnalysisBundle(response=response)
+    if not response.success:
+        return bundle
+
+    date_groups: dict[str, list] = {}
+    publisher_groups: dict[str, list] = defaultdict(list)
+    raw_image_data = bundle.raw_image_data
+    seen_urls = set()
+
+    # Articles arrive date-desc, so each date is one consecutive run.
+    # Extending an existing key keeps the grouping correct if it isn't.
+    descending = True
+    prev_key = None
+    for date_key, run in groupby(response.articles, key=_article_date):
+        run = list(run)
+        if date_key:
+            if date_key in date_groups:
+                date_groups[date_key].extend(run)
+            else:
+                date_groups[date_key] = run
+            if prev_key is not None and date_key >= prev_key:
+                descending = False
+            prev_key = date_key
+
+        for article in run:
+            publisher_groups[article.publisher or "Unknown"].append(article)
+
+    # Separate pass so it can stop as soon as enough candidates are found
+    # (extra collected for fallbacks when some fail to resolve)
+    for article in response.articles:
+        rd = article.raw_data
+        if not rd:
+            continue
+        img_url = next((v for k in _IMAGE_KEYS if (v := rd.get(k))), None)
+        if img_url and img_url not in seen_urls:
+            seen_urls.add(img_url)
+            raw_image_data.append({
+                "raw_url": img_url,
+                "title": article.title[:50],
+                "publisher": article.publisher,
+                "date": _article_date(article),
+            })
+            if len(raw_image_data) >= 12:
+                break
+
+    # Builders iterate dates oldest first; reversing the desc runs avoids a sort
+    if descending:
+        bundle.date_groups = dict(reversed(date_groups.items()))
+    else:
+        bundle.date_groups = dict(sorted(date_groups.items()))
+    bundle.publisher_groups = publisher_groups
+    return bundle
+
+
+def _build_timeline(bundle: _AnalysisBundle, granularity: str) -> list[dict]:
+    """Timeline entries with top publishers and headlines per bucket."""
+    if granularity in ("week", "month"):
+        # Coarser buckets are merged from the daily groups, so no article
+        # date is sliced again. Days are merged newest first so each bucket
+        # keeps the search order, then flipped back to ascending.
+        bucket = _week_start if granularity == "week" else (lambda day: day[:7])  # YYYY-MM
+        merged = defaultdict(list)
+        for day, articles in reversed(bundle.date_groups.items()):
+            merged[bucket(day)].extend(articles)
+        date_groups = dict(reversed(merged.items()))
+    else:  # day
+        date_groups = bundle.date_groups
+
+    # Build timeline data
+    timeline = []
+    for date_key, articles in date_groups.items():
+        publishers = Counter(a.publisher or "Unknown" for a in articles)
+
+        # Top 3 publishers
+        top_publishers = publishers.most_common(3)
+
+        # Representative headlines (top 3 by position)
+        headlines = [a.title for a in articles[:3]]
+
+        timeline.append({
+            "date": date_key,
+            "count": len(articles),
+            "publishers": [{"name": p[0], "count": p[1]} for p in top_publishers],
+            "headlines": headlines,
+        })
+
+    return timeline
+
+
+def _build_perspectives(bundle: _AnalysisBundle, limit: int) -> list[dict]:
+    """Per-publisher counts, date range, headlines and categories."""
+    # The analysis search uses sort_method="date", so BigKinds returns
+    # articles newest first and each publisher bucket keeps that order:
+    # the bucket's head is the latest article and its tail the earliest.
+    publishers = []
+    for pub_name, articles in bundle.publisher_groups.items():
+        # Get date range for this publisher
+        first_date = next((a.news_date[:10] for a in reversed(articles) if a.news_date), None)
+        last_date = next((a.news_date[:10] for a in articles if a.news_date), None)
+
+        # Representative headlines (5 most recent)
+        headlines = [
+            {
+                "title": a.title,
+                "date": a.news_date[:10] if a.news_date else None,
+            }
+            for a in articles[:5]
+        ]
+
+        # Category distribution
+        categories = Counter(a.category or "기타" for a in articles)
+        top_categories = categories.most_common(3)
+
+        publishers.append({
+            "name": pub_name,
+            "count": len(articles),
+            "first_date": first_date,
+            "last_date": last_date,
+            "headlines": headlines,
+            "categories": [{"name": c[0], "count": c[1]} for c in top_categories],
+        })
+
+    # Sort by article count (descending) and limit
+    return nlargest(limit, publishers, key=_count_key)
+
+
+async def _build_report(bundle: _AnalysisBundle) -> dict[str, Any]:
+    """Keyword arguments for report_response (minus keyword/period)."""
+    response = bundle.response
+
+    # ========== Timeline Analysis ==========
+    timeline = []
+    peak = None
+    dated_count = 0
+    for date_key, articles in bundle.date_groups.items():
+        entry = {
+            "date": date_key,
+            "count": len(articles),
+            "headlines": [a.title for a in articles[:2]],
+        }
+        timeline.append(entry)
+        dated_count += entry["count"]
+        # Strict > keeps the earliest date on ties, like max()
+        if peak is None or entry["count"] > peak["count"]:
+            peak = entry
+
+    # ========== Publisher Analysis ==========
+    publishers = []
+    for pub_name, articles in bundle.publisher_groups.items():
+        publishers.append({
+            "name": pub_name,
+            "count": len(articles),
+            "headlines": [a.title for a in articles[:3]],
+        })
+    publishers = nlargest(10, publishers, key=_count_key)
+
+    # ========== Key Events (spikes) ==========
+    # One pass; the average comes from the running total above
+    key_events = []
+    peak_event = None
+    if len(timeline) >= 3:
+        avg_count = dated_count / len(timeline)
+        threshold = avg_count * 2  # 2x average = significant event
+
+        prev_count = 0
+        for t in timeline:
+            count = t["count"]
+            if count >= threshold:
+                # Calculate growth from previous day
+                growth = ((count - prev_count) / prev_count * 100) if prev_count > 0 else 0
+
+                event = {
+                    "date": t["date"],
+                    "count": count,
+                    "growth": f"+{growth:.0f}%" if growth > 0 else f"{growth:.0f}%",
+                    "headline": t["headlines"][0] if t["headlines"] else None,
+                    "is_peak": t is peak,
+                }
+                key_events.append(event)
+                if t is peak:
+                    peak_event = event
+            prev_count = count
+
+    # Add the absolute peak if it wasn't a spike
+    if peak and not peak_event:
+        key_events.insert(0, {
+            "date": peak["date"],
+            "count": peak["count"],
+            "growth": "PEAK",
+            "headline": peak["headlines"][0] if peak["headlines"] else None,
+            "is_peak": True,
+        })
+
+    key_events = nlargest(5, key_events, key=_count_key)
+
+    # ========== Article Images (with extension fallback) ==========
+    raw_image_data = bundle.raw_image_data
+
+    # Resolve BigKinds URLs with extension fallback (parallel)
+    raw_urls = [d["raw_url"] for d in raw_image_data]
+    resolved_urls = await resolve_bigkinds_images_batch(raw_urls, timeout=2.0, limit=6)
+
+    # Build final images list (only successfully resolved)
+    images = []
+    for i, resolved_url in enumerate(resolved_urls):
+        if resolved_url and len(images) < 6:  # Max 6 images
+            images.append({
+                "url": resolved_url,
+                "title": raw_image_data[i]["title"],
+                "publisher": raw_image_data[i]["publisher"],
+                "date": raw_image_data[i]["date"],
+            })
+
+    # ========== Summary ==========
+    peak_item = peak or {}
+    summary = {
+        "total_articles": response.total_count,
+        "fetched_articles": len(response.articles),
+        "publisher_count": len(bundle.publisher_groups),
+        "date_range_days": len(timeline),
+        "peak_date": peak_item.get("date"),
+        "peak_count": peak_item.get("count", 0),
+        "avg_daily": round(len(response.articles) / max(len(timeline), 1), 1),
+    }
+
+    return {
+        "summary": summary,
+        "timeline": timeline,
+        "publishers": publishers,
+        "key_events": key_events,
+        "images": images,
+    }
+
+
+def _validate_timeline_range(start_date: str, end_date: str) -> dict[str, Any] | None:
+    """Error response if the period is too long to analyze, else None."""
+    # Parse dates
+    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+    end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+
+    # Limit date range to avoid too many API calls
+    max_days = 365
+    if (end_dt - start_dt).days > max_days:
+        return OAIResponse.error(
+            "INVALID_RANGE",
+            f"날짜 범위가 너무 넓습니다. 최대 {max_days}일까지 분석 가능합니다.",
+        )
+    return None
+
+
 @mcp.tool(
     annotations={
         "title": "Analyze News Timeline",
@@ -531,6 +994,7 @@ async def refresh_trends_cache(data_path: str) -> dict[str, Any]:
         "idempotentHint": True,
     }
 )
+@_async_ttl_cache
 async def analyze_timeline(
     keyword: str,
     start_date: str,
@@ -556,36 +1020,16 @@ async def analyze_timeline(
         Timeline analysis with daily/weekly/monthly article counts and top headlines
     """
     if not _client:
-        return OAIResponse.error("SERVER_ERROR", "서버가 초기화되지 않았습니다.")
-
-    from datetime import datetime, timedelta
-    from collections import defaultdict
-
-    from deep_news_oai.core.models import SearchRequest
+        return _ERR_NO_CLIENT
 
     try:
-        # Parse dates
-        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-
-        # Limit date range to avoid too many API calls
-        max_days = 365
-        if (end_dt - start_dt).days > max_days:
-            return OAIResponse.error(
-                "INVALID_RANGE",
-                f"날짜 범위가 너무 넓습니다. 최대 {max_days}일까지 분석 가능합니다.",
-            )
+        range_error = _validate_timeline_range(start_date, end_date)
+        if range_error:
+            return range_error
 
         # Fetch articles (up to 1000 for analysis)
-        request = SearchRequest(
-            keyword=keyword,
-            start_date=start_date,
-            end_date=end_date,
-            start_no=1,
-            result_number=1000,
-            sort_method="date",
-        )
-        response = await _client.search(request)
+        bundle = await _analyze_bundle(keyword, start_date, end_date)
+        response = bundle.response
 
         if not response.success:
             return OAIResponse.error(
@@ -593,56 +1037,11 @@ async def analyze_timeline(
                 response.error_message or "검색에 실패했습니다.",
             )
 
-        # Group articles by date
-        date_groups: dict[str, list] = defaultdict(list)
-
-        for article in response.articles:
-            if not article.news_date:
-                continue
-
-            # Extract date part (YYYY-MM-DD)
-            article_date = article.news_date[:10]
-
-            # Apply granularity
-            if granularity == "week":
-                dt = datetime.strptime(article_date, "%Y-%m-%d")
-                # Get start of week (Monday)
-                week_start = dt - timedelta(days=dt.weekday())
-                group_key = week_start.strftime("%Y-%m-%d")
-            elif granularity == "month":
-                group_key = article_date[:7]  # YYYY-MM
-            else:  # day
-                group_key = article_date
-
-            date_groups[group_key].append(article)
-
-        # Build timeline data
-        timeline = []
-        for date_key in sorted(date_groups.keys()):
-            articles = date_groups[date_key]
-            publishers = {}
-            for a in articles:
-                pub = a.publisher or "Unknown"
-                publishers[pub] = publishers.get(pub, 0) + 1
-
-            # Top 3 publishers
-            top_publishers = sorted(publishers.items(), key=lambda x: -x[1])[:3]
-
-            # Representative headlines (top 3 by position)
-            headlines = [a.title for a in articles[:3]]
-
-            timeline.append({
-                "date": date_key,
-                "count": len(articles),
-                "publishers": [{"name": p[0], "count": p[1]} for p in top_publishers],
-                "headlines": headlines,
-            })
-
         return timeline_response(
             keyword=keyword,
             start_date=start_date,
             end_date=end_date,
-            timeline=timeline,
+            timeline=_build_timeline(bundle, granularity),
             total_articles=response.total_count,
         )
 
@@ -662,6 +1061,7 @@ async def analyze_timeline(
         "idempotentHint": True,
     }
 )
+@_async_ttl_cache
 async def compare_perspectives(
     keyword: str,
     start_date: str,
@@ -687,23 +1087,12 @@ async def compare_perspectives(
         Publisher comparison with article counts, representative headlines, and coverage patterns
     """
     if not _client:
-        return OAIResponse.error("SERVER_ERROR", "서버가 초기화되지 않았습니다.")
-
-    from collections import defaultdict
-
-    from deep_news_oai.core.models import SearchRequest
+        return _ERR_NO_CLIENT
 
     try:
         # Fetch articles (up to 1000 for analysis)
-        request = SearchRequest(
-            keyword=keyword,
-            start_date=start_date,
-            end_date=end_date,
-            start_no=1,
-            result_number=1000,
-            sort_method="date",
-        )
-        response = await _client.search(request)
+        bundle = await _analyze_bundle(keyword, start_date, end_date)
+        response = bundle.response
 
         if not response.success:
             return OAIResponse.error(
@@ -711,62 +1100,11 @@ async def compare_perspectives(
                 response.error_message or "검색에 실패했습니다.",
             )
 
-        # Group articles by publisher
-        publisher_groups: dict[str, list] = defaultdict(list)
-
-        for article in response.articles:
-            publisher = article.publisher or "Unknown"
-            publisher_groups[publisher].append(article)
-
-        # Build publisher data
-        publishers = []
-        for pub_name, articles in publisher_groups.items():
-            # Sort by date (most recent first)
-            articles_sorted = sorted(
-                articles,
-                key=lambda a: a.news_date or "",
-                reverse=True
-            )
-
-            # Get date range for this publisher
-            dates = [a.news_date[:10] for a in articles_sorted if a.news_date]
-            first_date = min(dates) if dates else None
-            last_date = max(dates) if dates else None
-
-            # Representative headlines (first 5)
-            headlines = [
-                {
-                    "title": a.title,
-                    "date": a.news_date[:10] if a.news_date else None,
-                }
-                for a in articles_sorted[:5]
-            ]
-
-            # Category distribution
-            categories: dict[str, int] = {}
-            for a in articles:
-                cat = a.category or "기타"
-                categories[cat] = categories.get(cat, 0) + 1
-
-            top_categories = sorted(categories.items(), key=lambda x: -x[1])[:3]
-
-            publishers.append({
-                "name": pub_name,
-                "count": len(articles),
-                "first_date": first_date,
-                "last_date": last_date,
-                "headlines": headlines,
-                "categories": [{"name": c[0], "count": c[1]} for c in top_categories],
-            })
-
-        # Sort by article count (descending) and limit
-        publishers = sorted(publishers, key=lambda x: -x["count"])[:limit]
-
         return perspectives_response(
             keyword=keyword,
             start_date=start_date,
             end_date=end_date,
-            publishers=publishers,
+            publishers=_build_perspectives(bundle, limit),
             total_articles=response.total_count,
         )
 
@@ -784,6 +1122,7 @@ async def compare_perspectives(
         "idempotentHint": True,
     }
 )
+@_async_ttl_cache
 async def generate_report(
     keyword: str,
     start_date: str,
@@ -813,24 +1152,81 @@ async def generate_report(
         Comprehensive report with timeline, publishers, events, and images
     """
     if not _client:
-        return OAIResponse.error("SERVER_ERROR", "서버가 초기화되지 않았습니다.")
-
-    from datetime import datetime, timedelta
-    from collections import defaultdict
-
-    from deep_news_oai.core.models import SearchRequest
+        return _ERR_NO_CLIENT
 
     try:
         # Fetch articles (up to 1000 for analysis)
-        request = SearchRequest(
+        bundle = await _analyze_bundle(keyword, start_date, end_date)
+        response = bundle.response
+
+        if not response.success:
+            return OAIResponse.error(
+                "API_ERROR",
+                response.error_message or "검색에 실패했습니다.",
+            )
+
+        if not response.articles:
+            return OAIResponse.error(
+                "NO_DATA",
+                f"'{keyword}' 관련 기사를 찾을 수 없습니다.",
+            )
+
+        return report_response(
             keyword=keyword,
             start_date=start_date,
             end_date=end_date,
-            start_no=1,
-            result_number=1000,
-            sort_method="date",
+            **await _build_report(bundle),
         )
-        response = await _client.search(request)
+
+    except Exception as e:
+        logger.exception("Report generation error")
+        return OAIResponse.error("REPORT_ERROR", str(e))
+
+
+@mcp.tool(
+    annotations={
+        "title": "Analyze All (Timeline + Perspectives + Report)",
+        "readOnlyHint": True,
+        "openWorldHint": True,  # Calls external BigKinds API
+        "destructiveHint": False,
+        "idempotentHint": True,
+    }
+)
+@_async_ttl_cache
+async def analyze_all(
+    keyword: str,
+    start_date: str,
+    end_date: str,
+    granularity: str = "day",
+    limit: int = 10,
+) -> dict[str, Any]:
+    """
+    Run timeline, publisher comparison, and report analysis in one call.
+
+    Use this when the user wants a full dashboard for a topic and would
+    otherwise need analyze_timeline, compare_perspectives, and
+    generate_report separately. All three share one article fetch.
+
+    Args:
+        keyword: Search keyword (person, topic, or issue)
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+        granularity: Timeline grouping - "day", "week", or "month" (default: "day")
+        limit: Maximum number of publishers to compare (default: 10)
+
+    Returns:
+        Combined timeline, perspectives, and report results in OAI format
+    """
+    if not _client:
+        return _ERR_NO_CLIENT
+
+    try:
+        range_error = _validate_timeline_range(start_date, end_date)
+        if range_error:
+            return range_error
+
+        bundle = await _analyze_bundle(keyword, start_date, end_date)
+        response = bundle.response
 
         if not response.success:
             return OAIResponse.error(
@@ -844,148 +1240,54 @@ async def generate_report(
                 f"'{keyword}' 관련 기사를 찾을 수 없습니다.",
             )
 
-        # ========== Timeline Analysis ==========
-        date_groups: dict[str, list] = defaultdict(list)
-        for article in response.articles:
-            if article.news_date:
-                date_key = article.news_date[:10]
-                date_groups[date_key].append(article)
-
-        timeline = []
-        for date_key in sorted(date_groups.keys()):
-            articles = date_groups[date_key]
-            timeline.append({
-                "date": date_key,
-                "count": len(articles),
-                "headlines": [a.title for a in articles[:2]],
-            })
-
-        # ========== Publisher Analysis ==========
-        publisher_groups: dict[str, list] = defaultdict(list)
-        for article in response.articles:
-            pub = article.publisher or "Unknown"
-            publisher_groups[pub].append(article)
-
-        publishers = []
-        for pub_name, articles in publisher_groups.items():
-            publishers.append({
-                "name": pub_name,
-                "count": len(articles),
-                "headlines": [a.title for a in articles[:3]],
-            })
-        publishers = sorted(publishers, key=lambda x: -x["count"])[:10]
-
-        # ========== Key Events (spikes) ==========
-        key_events = []
-        if len(timeline) >= 3:
-            counts = [t["count"] for t in timeline]
-            avg_count = sum(counts) / len(counts)
-            threshold = avg_count * 2  # 2x average = significant event
-
-            for i, t in enumerate(timeline):
-                if t["count"] >= threshold:
-                    # Calculate growth from previous day
-                    prev_count = timeline[i-1]["count"] if i > 0 else 0
-                    growth = ((t["count"] - prev_count) / prev_count * 100) if prev_count > 0 else 0
-
-                    key_events.append({
-                        "date": t["date"],
-                        "count": t["count"],
-                        "growth": f"+{growth:.0f}%" if growth > 0 else f"{growth:.0f}%",
-                        "headline": t["headlines"][0] if t["headlines"] else None,
-                        "is_peak": False,
-                    })
-
-        # Mark absolute peak
-        if timeline:
-            peak = max(timeline, key=lambda x: x["count"])
-            peak_event = next((e for e in key_events if e["date"] == peak["date"]), None)
-            if peak_event:
-                peak_event["is_peak"] = True
-            else:
-                key_events.insert(0, {
-                    "date": peak["date"],
-                    "count": peak["count"],
-                    "growth": "PEAK",
-                    "headline": peak["headlines"][0] if peak["headlines"] else None,
-                    "is_peak": True,
-                })
-
-        key_events = sorted(key_events, key=lambda x: -x["count"])[:5]
-
-        # ========== Article Images (with extension fallback) ==========
-        # Collect raw image URLs and article metadata
-        raw_image_data = []
-        seen_urls = set()
-        for article in response.articles:
-            if article.raw_data and len(raw_image_data) < 12:  # Collect extra for fallbacks
-                img_url = (
-                    article.raw_data.get("IMAGES") or
-                    article.raw_data.get("images") or
-                    article.raw_data.get("IMAGE_URL") or
-                    article.raw_data.get("imageUrl") or
-                    article.raw_data.get("THUMBNAIL") or
-                    article.raw_data.get("thumbnail")
-                )
-                if img_url and img_url not in seen_urls:
-                    seen_urls.add(img_url)
-                    raw_image_data.append({
-                        "raw_url": img_url,
-                        "title": article.title[:50],
-                        "publisher": article.publisher,
-                        "date": article.news_date[:10] if article.news_date else None,
-                    })
-
-        # Resolve BigKinds URLs with extension fallback (parallel)
-        raw_urls = [d["raw_url"] for d in raw_image_data]
-        resolved_urls = await resolve_bigkinds_images_batch(raw_urls, timeout=2.0)
-
-        # Build final images list (only successfully resolved)
-        images = []
-        for i, resolved_url in enumerate(resolved_urls):
-            if resolved_url and len(images) < 6:  # Max 6 images
-                images.append({
-                    "url": resolved_url,
-                    "title": raw_image_data[i]["title"],
-                    "publisher": raw_image_data[i]["publisher"],
-                    "date": raw_image_data[i]["date"],
-                })
-
-        # ========== Summary ==========
-        peak_item = max(timeline, key=lambda x: x["count"]) if timeline else {}
-        summary = {
-            "total_articles": response.total_count,
-            "fetched_articles": len(response.articles),
-            "publisher_count": len(publisher_groups),
-            "date_range_days": len(timeline),
-            "peak_date": peak_item.get("date"),
-            "peak_count": peak_item.get("count", 0),
-            "avg_daily": round(len(response.articles) / max(len(timeline), 1), 1),
-        }
-
-        return report_response(
+        timeline = timeline_response(
             keyword=keyword,
             start_date=start_date,
             end_date=end_date,
-            summary=summary,
-            timeline=timeline,
-            publishers=publishers,
-            key_events=key_events,
-            images=images,
+            timeline=_build_timeline(bundle, granularity),
+            total_articles=response.total_count,
+        )
+        perspectives = perspectives_response(
+            keyword=keyword,
+            start_date=start_date,
+            end_date=end_date,
+            publishers=_build_perspectives(bundle, limit),
+            total_articles=response.total_count,
+        )
+        report = report_response(
+            keyword=keyword,
+            start_date=start_date,
+            end_date=end_date,
+            **await _build_report(bundle),
         )
 
+        # Report data drives the widget; the other two ride along in _meta
+        return OAIResponse.success(
+            structured={
+                "timeline": timeline["structuredContent"],
+                "perspectives": perspectives["structuredContent"],
+                "report": report["structuredContent"],
+            },
+            content="\n".join((timeline["content"], perspectives["content"], report["content"])),
+            full_data=report["_meta"]["full_data"],
+            widget="report",
+            extra_meta={
+                "timeline": timeline["_meta"]["full_data"],
+                "perspectives": perspectives["_meta"]["full_data"],
+            },
+        )
+
+    except ValueError as e:
+        return OAIResponse.error("INVALID_DATE", f"날짜 형식 오류: {e}")
     except Exception as e:
-        logger.exception("Report generation error")
-        return OAIResponse.error("REPORT_ERROR", str(e))
+        logger.exception("Combined analysis error")
+        return OAIResponse.error("ANALYSIS_ERROR", str(e))
 
 
 # =============================================================================
-# WIDGETS: Resource registration (with LRU caching)
+# WIDGETS: Resource registration (preloaded at import)
 # =============================================================================
 
-from deep_news_oai.widgets.loader import load_widget
-
-
 @mcp.resource(
     "widget://search_results",
     mime_type="text/html+skybridge",
@@ -1051,22 +1353,54 @@ def report_widget() -> str:
 # =============================================================================
 
 from starlette.applications import Starlette
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 from starlette.routing import Route, Mount
 
 
-async def health_check(request):
-    """Health check endpoint for Docker/K8s."""
-    return JSONResponse({
+def _health_body(client_initialized: bool) -> bytes:
+    """Encoded /health payload."""
+    return orjson.dumps({
         "status": "healthy",
         "service": "deep-news-oai",
-        "client_initialized": _client is not None,
+        "client_initialized": client_initialized,
     })
 
 
+# Both possible bodies, encoded once
+_HEALTH_OK: Final = _health_body(True)
+_HEALTH_PENDING: Final = _health_body(False)
+
+
+async def health_check(request):
+    """Health check endpoint for Docker/K8s."""
+    # Kept async: Starlette would run a sync endpoint in its threadpool
+    body = _HEALTH_OK if _client is not None else _HEALTH_PENDING
+    return Response(body, media_type="application/json")
+
+
+async def widget_http(request):
+    """Serve a widget's precompressed HTML with ETag revalidation.
+
+    MCP resources travel as JSON-RPC text with no per-resource headers,
+    so gzip and 304s are only available on this plain HTTP route.
+    """
+    name = request.path_params["name"]
+    etag = widget_etag(name)
+    if etag is None:
+        return Response(status_code=404)
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=300", "Vary": "Accept-Encoding"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(load_widget_gzip(name), media_type="text/html", headers=headers)
+    return Response(load_widget_bytes(name), media_type="text/html", headers=headers)
+
+
 # Create combined app with health check
 health_routes = [
     Route("/health", health_check),
+    Route("/widgets/{name}.html", widget_http),
 ]
 
 # Middleware to allow any host
@@ -1082,6 +1416,7 @@ app = Starlette(
     middleware=[
         Middleware(TrustedHostMiddleware, allowed_hosts=["*"]),
     ],
+    lifespan=lifespan,
 )
 
 
@@ -1092,11 +1427,18 @@ app = Starlette(
 def run_server():
     """Run the MCP server."""
     import uvicorn
+
+    # loop/http "auto" pick uvloop and httptools when installed (uvicorn[standard])
+    # and fall back to asyncio/h11 otherwise. SSE sessions live in the process
+    # that opened them, so extra workers need sticky routing in front.
     uvicorn.run(
         "deep_news_oai.server:app",
         host="0.0.0.0",
         port=8000,
         reload=False,
+        loop="auto",
+        http="auto",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
     )
 
 
@@ -1,11 +1,14 @@
-"""Widget file loader with caching.
+"""Widget file loader.
 
-Following OpenAI Apps SDK examples pattern:
-- Use functools.lru_cache for efficient widget loading
-- Reduce I/O overhead on repeated calls
+Widgets are a handful of static HTML files shipped with the package,
+so they are all read once at import into a dict; load_widget is a
+plain lookup with no file I/O on the request path. Raw UTF-8 bytes,
+gzipped bodies and ETags are precomputed alongside for plain HTTP
+serving.
 """
 
-from functools import lru_cache
+import gzip
+import hashlib
 from pathlib import Path
 
 WIDGET_DIR = Path(__file__).parent
@@ -20,13 +23,36 @@ _FALLBACK_HTML = """<!DOCTYPE html>
 </html>"""
 
 
-@lru_cache(maxsize=16)
+def _scan_widgets() -> dict[str, bytes]:
+    """Read every widget HTML file in WIDGET_DIR as bytes, keyed by file stem."""
+    return {p.stem: p.read_bytes() for p in WIDGET_DIR.glob("*.html")}
+
+
+_WIDGET_BYTES: dict[str, bytes] = {}
+_WIDGETS: dict[str, str] = {}
+_WIDGET_GZIP: dict[str, bytes] = {}
+_WIDGET_ETAG: dict[str, str] = {}
+
+
+def _load_all() -> None:
+    """Rebuild every widget table from the files on disk."""
+    global _WIDGET_BYTES, _WIDGETS, _WIDGET_GZIP, _WIDGET_ETAG
+    _WIDGET_BYTES = _scan_widgets()
+    # MCP resources must be str; plain HTTP serves the raw bytes directly
+    _WIDGETS = {name: data.decode("utf-8") for name, data in _WIDGET_BYTES.items()}
+    _WIDGET_GZIP = {name: gzip.compress(data, mtime=0) for name, data in _WIDGET_BYTES.items()}
+    _WIDGET_ETAG = {
+        name: f'"{hashlib.blake2b(data, digest_size=8).hexdigest()}"'
+        for name, data in _WIDGET_BYTES.items()
+    }
+
+
+_load_all()
+
+
 def load_widget(name: str) -> str:
     """
-    Load widget HTML by name with caching.
-
-    Uses LRU cache to avoid repeated file I/O.
-    Cache size of 16 is sufficient for typical widget count.
+    Load widget HTML by name.
 
     Args:
         name: Widget name without extension (e.g., "search_results")
@@ -34,12 +60,24 @@ def load_widget(name: str) -> str:
     Returns:
         Widget HTML content or fallback HTML if not found
     """
-    widget_path = WIDGET_DIR / f"{name}.html"
-    if widget_path.exists():
-        return widget_path.read_text(encoding="utf-8")
-    return _FALLBACK_HTML
+    return _WIDGETS.get(name, _FALLBACK_HTML)
+
+
+def load_widget_bytes(name: str) -> bytes | None:
+    """Return the widget HTML as UTF-8 bytes, or None if not found."""
+    return _WIDGET_BYTES.get(name)
+
+
+def load_widget_gzip(name: str) -> bytes | None:
+    """Return the precomputed gzipped widget HTML, or None if not found."""
+    return _WIDGET_GZIP.get(name)
+
+
+def widget_etag(name: str) -> str | None:
+    """Return the quoted ETag for a widget, or None if not found."""
+    return _WIDGET_ETAG.get(name)
 
 
 def clear_widget_cache() -> None:
-    """Clear the widget cache. Useful for development/testing."""
-    load_widget.cache_clear()
+    """Re-read widget files from disk. Useful for development/testing."""
+    _load_all()
@@ -1,6 +1,77 @@
 """Pytest configuration and fixtures."""
 
+import asyncio
+from collections import OrderedDict
+
 import pytest
+from starlette.testclient import TestClient
+
+from deep_news_oai.core.models import SearchResponse
+
+
+class FakeBigKinds:
+    """BigKinds client stand-in that records searches and image batches.
+
+    ``articles`` is either a list or a callable taking the request;
+    ``resolve`` maps a batch of image URLs to resolved URLs.
+    """
+
+    def __init__(self, articles, delay=0.0):
+        self.articles = articles
+        self.delay = delay
+        self.success = True
+        self.calls = []
+        self.batches = []
+        self.resolve = lambda urls: []
+
+    async def search(self, request):
+        self.calls.append(request)
+        await asyncio.sleep(self.delay)
+        articles = self.articles(request) if callable(self.articles) else self.articles
+        return SearchResponse(success=self.success, total_count=len(articles), articles=articles)
+
+    async def resolve_images_batch(self, urls, **kwargs):
+        self.batches.append(urls)
+        return self.resolve(urls)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """HTTP client for the combined Starlette app, shared by all tests.
+
+    Not entered as a context manager, so the app lifespan (real BigKinds
+    client) does not run; tests install fakes as needed.
+    """
+    from deep_news_oai.server import app
+
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def tool_names():
+    """Names of all registered MCP tools."""
+    from deep_news_oai.server import mcp
+
+    return [t.name for t in mcp._tool_manager.list_tools()]
+
+
+@pytest.fixture
+def fake_bigkinds(monkeypatch):
+    """Factory installing a FakeBigKinds as the server client.
+
+    Also resets the search cache and stubs image resolution, so tools
+    run without network access.
+    """
+    from deep_news_oai import server
+
+    def install(articles=(), delay=0.0):
+        fake = FakeBigKinds(articles if callable(articles) else list(articles), delay)
+        monkeypatch.setattr(server, "_client", fake)
+        monkeypatch.setattr(server, "_search_cache", OrderedDict())
+        monkeypatch.setattr(server, "resolve_bigkinds_images_batch", fake.resolve_images_batch)
+        return fake
+
+    return install
 
 
 @pytest.fixture
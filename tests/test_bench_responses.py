@@ -0,0 +1,78 @@
+"""Response builder microbenchmarks.
+
+Run with `pytest tests/test_bench_responses.py --benchmark-only`.
+Inputs are built outside the measured call via benchmark.pedantic.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from deep_news_oai.responses.builder import (
+    article_response,
+    search_response,
+    trending_response,
+)
+
+ROUNDS = 200
+ITERATIONS = 50
+
+
+def test_bench_search_response(benchmark):
+    """search_response over one page of articles."""
+    articles = [
+        {"title": f"기사 {i}", "publisher": "경향신문", "date": "2025-01-01"}
+        for i in range(20)
+    ]
+
+    result = benchmark.pedantic(
+        search_response,
+        kwargs={
+            "total_count": 1000,
+            "page": 1,
+            "page_size": 20,
+            "articles": articles,
+            "keyword": "AI",
+        },
+        rounds=ROUNDS,
+        iterations=ITERATIONS,
+    )
+
+    assert result["structuredContent"]["total_count"] == 1000
+
+
+def test_bench_article_response(benchmark):
+    """article_response with content long enough to be summarized."""
+    result = benchmark.pedantic(
+        article_response,
+        kwargs={
+            "news_id": "123",
+            "title": "기사 제목",
+            "content_text": "기사 본문입니다. " * 200,
+            "publisher": "경향신문",
+            "published_date": "2025-01-01T12:00:00",
+            "url": "https://example.com/article/123",
+            "images": [f"https://img.example.com/{i}.jpg" for i in range(5)],
+        },
+        rounds=ROUNDS,
+        iterations=ITERATIONS,
+    )
+
+    assert result["structuredContent"]["news_id"] == "123"
+
+
+def test_bench_trending_response(benchmark):
+    """trending_response for a typical issue list."""
+    issues = [
+        {"rank": i, "title": f"이슈 {i}", "keywords": ["AI", "경제", "정치", "사회"]}
+        for i in range(1, 11)
+    ]
+
+    result = benchmark.pedantic(
+        trending_response,
+        kwargs={"issues": issues, "date": "2025-01-01"},
+        rounds=ROUNDS,
+        iterations=ITERATIONS,
+    )
+
+    assert result["structuredContent"]["issue_count"] == 10
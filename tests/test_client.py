@@ -0,0 +1,73 @@
+"""BigKinds client tests."""
+
+import json
+
+import httpx
+import pytest
+
+from deep_news_oai.core.client import BigKindsClient
+from deep_news_oai.core.models import SearchRequest
+
+
+def _api_handler(request):
+    return httpx.Response(
+        200,
+        json={"success": True, "totalCount": 1, "resultList": [{"TITLE": "AI 뉴스"}]},
+    )
+
+
+@pytest.fixture
+def bk_client():
+    """BigKindsClient backed by a mock transport."""
+    bk = BigKindsClient(rate_limit_delay=0.2)
+    bk._client = httpx.AsyncClient(transport=httpx.MockTransport(_api_handler))
+    return bk
+
+
+@pytest.fixture
+def search_request():
+    """Minimal search request."""
+    return SearchRequest(keyword="AI", start_date="2025-01-01", end_date="2025-01-31")
+
+
+class TestBigKindsClient:
+    """BigKindsClient tests."""
+
+    async def test_search_parses_response(self, bk_client, search_request):
+        """Should decode the API payload into a SearchResponse."""
+        response = await bk_client.search(search_request)
+
+        assert response.success is True
+        assert response.total_count == 1
+        assert response.articles[0].title == "AI 뉴스"
+
+    async def test_first_request_is_not_delayed(self, bk_client, search_request, monkeypatch):
+        """Rate limiting should only space out back-to-back requests."""
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr("deep_news_oai.core.client.asyncio.sleep", fake_sleep)
+
+        await bk_client.search(search_request)
+        assert sleeps == []
+
+        await bk_client.search(search_request)
+        assert len(sleeps) == 1
+        assert 0 < sleeps[0] <= bk_client.rate_limit_delay
+
+    async def test_request_body_is_api_payload(self, search_request):
+        """The JSON body should match the request's API payload."""
+        seen = {}
+
+        def handler(request):
+            seen["body"] = json.loads(request.content)
+            return _api_handler(request)
+
+        bk = BigKindsClient()
+        bk._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        await bk.search(search_request)
+
+        assert seen["body"] == search_request.to_api_payload()
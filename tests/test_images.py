@@ -0,0 +1,374 @@
+"""Image extraction tests."""
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from deep_news_oai.core import images
+from deep_news_oai.core.images import (
+    _find_meta_image,
+    clear_image_cache,
+    close_shared_client,
+    extract_images_batch,
+    extract_og_image,
+    resolve_bigkinds_image_url,
+    resolve_bigkinds_images_batch,
+    validate_image_url,
+)
+
+
+ARTICLE_HTML = """<!DOCTYPE html>
+<html><head>
+<meta property="og:image" content="https://img.example.com/photo.jpg">
+</head><body>기사 본문</body></html>"""
+
+
+@pytest.fixture
+async def mock_client(monkeypatch, tmp_path):
+    """Install a shared client backed by a mock transport."""
+    clear_image_cache()
+    monkeypatch.setattr(images, "BIGKINDS_EXT_CACHE_PATH", tmp_path / "ext_cache.json")
+    monkeypatch.setattr(images, "_ext_cache", None)
+
+    def install(handler):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(images, "_shared_client", client)
+        return client
+
+    yield install
+    await close_shared_client()
+
+
+class TestSharedClient:
+    """Shared image client tests."""
+
+    async def test_shared_client_is_reused(self):
+        """Repeated lookups should reuse one pooled client."""
+        client1 = images._get_shared_client()
+        client2 = images._get_shared_client()
+
+        assert client1 is client2
+
+        await close_shared_client()
+        assert images._shared_client is None
+
+
+class TestFindMetaImage:
+    """Meta tag parsing tests."""
+
+    def test_prefers_og_image_over_twitter(self):
+        """og:image should win even when twitter:image comes first."""
+        html = (
+            '<meta name="twitter:image" content="https://img.example.com/tw.jpg">'
+            '<meta property="og:image" content="https://img.example.com/og.jpg">'
+        )
+
+        assert _find_meta_image(html) == "https://img.example.com/og.jpg"
+
+    def test_handles_attribute_order_and_quotes(self):
+        """Should parse content-before-property and single quotes."""
+        html = "<META content='https://img.example.com/a.png' property='og:image' />"
+
+        assert _find_meta_image(html) == "https://img.example.com/a.png"
+
+    def test_falls_back_to_twitter_image(self):
+        """Should use twitter:image when og:image is missing."""
+        html = '<meta name="twitter:image" content="https://img.example.com/tw.jpg">'
+
+        assert _find_meta_image(html) == "https://img.example.com/tw.jpg"
+
+    def test_ignores_og_image_dimensions(self):
+        """og:image:width and similar tags are not image URLs."""
+        html = '<meta property="og:image:width" content="1200">'
+
+        assert _find_meta_image(html) is None
+
+
+class TestExtractOgImage:
+    """og:image extraction tests."""
+
+    async def test_extracts_og_image(self, mock_client):
+        """Should return the og:image content URL."""
+        mock_client(lambda request: httpx.Response(200, html=ARTICLE_HTML))
+
+        result = await extract_og_image("https://news.example.com/article/1")
+
+        assert result == "https://img.example.com/photo.jpg"
+
+    async def test_requests_partial_content(self, mock_client):
+        """Should request only the head of the page and accept 206."""
+        seen = {}
+
+        def handler(request):
+            seen["range"] = request.headers.get("range")
+            return httpx.Response(206, html=ARTICLE_HTML)
+
+        mock_client(handler)
+
+        result = await extract_og_image("https://news.example.com/article/2")
+
+        assert seen["range"] == f"bytes=0-{images.MAX_HTML_BYTES - 1}"
+        assert result == "https://img.example.com/photo.jpg"
+
+    async def test_uses_injected_client(self, mock_client):
+        """An explicitly passed client should be used instead of the shared one."""
+        mock_client(lambda request: httpx.Response(500))
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, html=ARTICLE_HTML))
+        )
+
+        result = await extract_og_image("https://news.example.com/article/3", client=client)
+
+        assert result == "https://img.example.com/photo.jpg"
+        await client.aclose()
+
+    async def test_non_html_returns_none(self, mock_client):
+        """Should not parse bodies of non-HTML responses."""
+        mock_client(
+            lambda request: httpx.Response(
+                200, content=b"%PDF-1.7", headers={"content-type": "application/pdf"}
+            )
+        )
+
+        result = await extract_og_image("https://news.example.com/file")
+
+        assert result is None
+
+    async def test_non_200_returns_none(self, mock_client):
+        """Should return None for failed page fetches."""
+        mock_client(lambda request: httpx.Response(404))
+
+        result = await extract_og_image("https://news.example.com/missing")
+
+        assert result is None
+
+    async def test_results_are_cached(self, mock_client):
+        """Repeated lookups for the same URL should not refetch."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url)
+            return httpx.Response(200, html=ARTICLE_HTML)
+
+        mock_client(handler)
+
+        url = "https://news.example.com/article/cached"
+        first = await extract_og_image(url)
+        second = await extract_og_image(url)
+
+        assert first == second == "https://img.example.com/photo.jpg"
+        assert len(calls) == 1
+
+    async def test_misses_are_cached(self, mock_client):
+        """Failed lookups should also be cached."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url)
+            return httpx.Response(500)
+
+        mock_client(handler)
+
+        url = "https://news.example.com/article/broken"
+        assert await extract_og_image(url) is None
+        assert await extract_og_image(url) is None
+        assert len(calls) == 1
+
+
+class TestResolveBigkindsImage:
+    """BigKinds image extension resolution tests."""
+
+    async def test_non_bigkinds_url_passthrough(self):
+        """Non-BigKinds URLs should be returned unchanged."""
+        url = "https://img.example.com/photo"
+
+        assert await resolve_bigkinds_image_url(url) == url
+
+    async def test_resolves_extension(self, mock_client):
+        """Should return the URL with the extension that serves an image."""
+
+        def handler(request):
+            if request.url.path.endswith(".png"):
+                return httpx.Response(200, headers={"content-type": "image/png"})
+            return httpx.Response(404)
+
+        mock_client(handler)
+
+        result = await resolve_bigkinds_image_url("https://www.bigkinds.or.kr/resources/images/abc")
+
+        assert result == "https://www.bigkinds.or.kr/resources/images/abc.png"
+
+    async def test_resolved_extension_is_persisted(self, mock_client):
+        """Resolved extensions should be reused and written to disk."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url)
+            return httpx.Response(200, headers={"content-type": "image/jpeg"})
+
+        mock_client(handler)
+        base_url = "https://www.bigkinds.or.kr/resources/images/def"
+
+        assert await resolve_bigkinds_image_url(base_url) == f"{base_url}.jpg"
+        probes = len(calls)
+        assert await resolve_bigkinds_image_url(base_url) == f"{base_url}.jpg"
+        assert len(calls) == probes
+
+        await close_shared_client()
+        assert images.BIGKINDS_EXT_CACHE_PATH.exists()
+
+    async def test_unresolvable_returns_none(self, mock_client):
+        """Should return None when no extension serves an image."""
+        mock_client(lambda request: httpx.Response(404))
+
+        result = await resolve_bigkinds_image_url("https://www.bigkinds.or.kr/resources/images/none")
+
+        assert result is None
+
+
+class TestExtCachePersistence:
+    """Persisted extension cache tests."""
+
+    async def test_entries_added_during_write_are_flushed(self, mock_client, monkeypatch):
+        """An entry recorded while a write is running should be written next."""
+        monkeypatch.setattr(images, "EXT_CACHE_FLUSH_DELAY", 0)
+        started = threading.Event()
+        real_write = images._write_ext_cache
+
+        def slow_write(version, data):
+            started.set()
+            time.sleep(0.05)
+            return real_write(version, data)
+
+        monkeypatch.setattr(images, "_write_ext_cache", slow_write)
+
+        images._remember_ext("https://www.bigkinds.or.kr/a", ".jpg")
+        task = images._ext_cache_flush_task
+        await asyncio.to_thread(started.wait)
+        images._remember_ext("https://www.bigkinds.or.kr/b", ".png")
+        await task
+
+        saved = json.loads(images.BIGKINDS_EXT_CACHE_PATH.read_text(encoding="utf-8"))
+        assert saved == {
+            "https://www.bigkinds.or.kr/a": ".jpg",
+            "https://www.bigkinds.or.kr/b": ".png",
+        }
+
+    async def test_older_snapshot_does_not_overwrite_newer(self, mock_client):
+        """A late write of an older snapshot should be skipped."""
+        images._remember_ext("https://www.bigkinds.or.kr/a", ".jpg")
+        old = images._take_ext_cache_snapshot()
+        images._remember_ext("https://www.bigkinds.or.kr/b", ".png")
+        images._save_ext_cache()
+
+        assert images._write_ext_cache(*old)
+        saved = json.loads(images.BIGKINDS_EXT_CACHE_PATH.read_text(encoding="utf-8"))
+        assert "https://www.bigkinds.or.kr/b" in saved
+
+    async def test_cache_is_capped(self, mock_client, monkeypatch):
+        """The cache should keep at most EXT_CACHE_SIZE entries."""
+        monkeypatch.setattr(images, "EXT_CACHE_SIZE", 2)
+
+        for name in ("a", "b", "c"):
+            images._remember_ext(f"https://www.bigkinds.or.kr/{name}", ".jpg")
+
+        assert list(images._load_ext_cache()) == [
+            "https://www.bigkinds.or.kr/b",
+            "https://www.bigkinds.or.kr/c",
+        ]
+
+
+class TestResolveBigkindsImagesBatch:
+    """Batch BigKinds image resolution tests."""
+
+    async def test_results_follow_input_order(self, mock_client):
+        """Resolved URLs should line up with the input, empty for failures."""
+
+        def handler(request):
+            if "/missing" in request.url.path:
+                return httpx.Response(404)
+            return httpx.Response(200, headers={"content-type": "image/jpeg"})
+
+        mock_client(handler)
+        base = "https://www.bigkinds.or.kr/resources/images"
+
+        result = await resolve_bigkinds_images_batch([f"{base}/a", f"{base}/missing", f"{base}/b"])
+
+        assert result == [f"{base}/a.jpg", "", f"{base}/b.jpg"]
+
+    async def test_limit_stops_without_waiting_for_slow_urls(self, mock_client):
+        """Should return once limit URLs resolve, leaving slow ones empty."""
+
+        async def handler(request):
+            if "/slow" in request.url.path:
+                await asyncio.sleep(10)
+            return httpx.Response(200, headers={"content-type": "image/jpeg"})
+
+        mock_client(handler)
+        base = "https://www.bigkinds.or.kr/resources/images"
+        urls = [f"{base}/slow", f"{base}/a", f"{base}/b"]
+
+        result = await asyncio.wait_for(resolve_bigkinds_images_batch(urls, limit=2), timeout=1.0)
+
+        assert result == ["", f"{base}/a.jpg", f"{base}/b.jpg"]
+
+
+class TestExtractImagesBatch:
+    """Batch og:image extraction tests."""
+
+    async def test_stops_after_max_images(self, mock_client):
+        """Should return at most max_images results."""
+        mock_client(lambda request: httpx.Response(200, html=ARTICLE_HTML))
+        articles = [
+            {"url": f"https://news.example.com/article/{i}", "title": f"기사 {i}"}
+            for i in range(10)
+        ]
+
+        result = await extract_images_batch(articles, max_images=3)
+
+        assert len(result) == 3
+        assert all(r["url"] == "https://img.example.com/photo.jpg" for r in result)
+
+    async def test_skips_blocked_hosts_and_direct_images(self, mock_client):
+        """Video hosts are skipped and direct image links need no fetch."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url)
+            return httpx.Response(200, html=ARTICLE_HTML)
+
+        mock_client(handler)
+        articles = [
+            {"url": "https://www.youtube.com/watch?v=abc", "title": "영상"},
+            {"url": "https://img.example.com/direct.png?w=600", "title": "이미지"},
+        ]
+
+        result = await extract_images_batch(articles)
+
+        assert [r["url"] for r in result] == ["https://img.example.com/direct.png?w=600"]
+        assert calls == []
+
+    async def test_empty_articles(self):
+        """Should return empty list for no articles."""
+        assert await extract_images_batch([]) == []
+
+
+class TestValidateImageUrl:
+    """Image URL validation tests."""
+
+    def test_accepts_image_urls(self):
+        """Should accept http(s) URLs with image extensions or CDN paths."""
+        assert validate_image_url("https://img.example.com/a")
+        assert validate_image_url("http://example.com/photo/1.JPG")
+        assert validate_image_url("https://example.com/images/abc")
+
+    def test_rejects_invalid_urls(self):
+        """Should reject non-http URLs, non-images, and non-strings."""
+        assert not validate_image_url("ftp://example.com/a.jpg")
+        assert not validate_image_url("https://example.com/article/1")
+        assert not validate_image_url("")
+        assert not validate_image_url(None)
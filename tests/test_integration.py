@@ -7,7 +7,6 @@ Run with: uv run pytest tests/test_integration.py -v
 """
 
 import httpx
-import pytest
 
 # Server URL
 BASE_URL = "https://deepnews-oai.seolcoding.com"
@@ -0,0 +1,71 @@
+"""BigKinds data model tests."""
+
+from deep_news_oai.core.models import NewsArticle, SearchRequest, SearchResponse
+
+
+class TestNewsArticle:
+    """NewsArticle mapping tests."""
+
+    def test_from_api_response_maps_uppercase_keys(self):
+        """Should map BigKinds uppercase keys to model fields."""
+        data = {
+            "NEWS_ID": "01101202.20241220110009001",
+            "TITLE": "AI 기술 혁신",
+            "PROVIDER": "경향신문",
+            "NEWS_DATE": "2024-12-20T11:00:09",
+            "PROVIDER_LINK_PAGE": "https://example.com/article/1",
+        }
+
+        article = NewsArticle.from_api_response(data)
+
+        assert article.news_id == "01101202.20241220110009001"
+        assert article.title == "AI 기술 혁신"
+        assert article.publisher == "경향신문"
+        assert article.url == "https://example.com/article/1"
+        assert article.raw_data is data
+
+    def test_from_api_response_falls_back_to_later_aliases(self):
+        """Empty values should fall through to the next alias."""
+        data = {"TITLE": "", "title": "fallback", "CONTENT": "", "SUMMARY": "요약"}
+
+        article = NewsArticle.from_api_response(data)
+
+        assert article.title == "fallback"
+        assert article.content == "요약"
+
+    def test_from_api_response_defaults(self):
+        """Missing fields should use model defaults."""
+        article = NewsArticle.from_api_response({})
+
+        assert article.title == ""
+        assert article.news_id is None
+        assert article.to_structured()["date"] is None
+
+    def test_to_full_is_memoized(self):
+        """Repeated conversions should return the same dict."""
+        article = NewsArticle.from_api_response({"TITLE": "기사", "NEWS_DATE": "2025-01-01T09:00"})
+
+        assert article.to_full() is article.to_full()
+        assert article.to_structured() is article.to_structured()
+        assert article.to_structured()["date"] == "2025-01-01"
+
+
+class TestSearchResponse:
+    """SearchResponse mapping tests."""
+
+    def test_from_api_response(self):
+        """Should build articles and coerce counts from the API payload."""
+        request = SearchRequest(keyword="AI", start_date="2025-01-01", end_date="2025-01-31")
+        data = {
+            "success": True,
+            "totalCount": "2",
+            "resultList": [{"TITLE": "기사 1"}, {"TITLE": "기사 2"}],
+        }
+
+        response = SearchResponse.from_api_response(data, request)
+
+        assert response.success is True
+        assert response.total_count == 2
+        assert [a.title for a in response.articles] == ["기사 1", "기사 2"]
+        assert response.date_range == "2025-01-01 to 2025-01-31"
+        assert response.search_time is not None
@@ -6,8 +6,65 @@ from deep_news_oai.responses.builder import (
     search_response,
     article_response,
     trending_response,
+    timeline_response,
+    report_response,
 )
 
+_OAI_KEYS = frozenset({"structuredContent", "content", "_meta"})
+_CSP_REQUIRED = frozenset({"*.chosun.com", "*.bigkinds.or.kr"})
+
+
+def _assert_oai(response):
+    """Assert the response has the OAI 3형제 fields."""
+    assert _OAI_KEYS <= response.keys()
+
+
+SEARCH_ARTICLES = [
+    {"title": "AI News 1", "publisher": "경향신문", "date": "2025-01-01"},
+    {"title": "AI News 2", "publisher": "조선일보", "date": "2025-01-02"},
+]
+
+
+@pytest.fixture(scope="module")
+def widget_success_response():
+    """A widget success response, shared read-only across tests."""
+    return OAIResponse.success(
+        structured={"test": "data"},
+        content="Test content",
+        widget="search_results",
+    )
+
+
+@pytest.fixture(scope="module")
+def long_article():
+    """Article body longer than the structured summary limit."""
+    return "This is the article content" * 20
+
+
+@pytest.fixture(scope="module")
+def article_resp(long_article):
+    """An article detail response, shared read-only across tests."""
+    return article_response(
+        news_id="123",
+        title="Test Article",
+        content_text=long_article,
+        publisher="경향신문",
+        published_date="2025-01-01T12:00:00",
+        url="https://example.com/article/123",
+    )
+
+
+@pytest.fixture(scope="module")
+def search_resp():
+    """A search response with a next page, shared read-only across tests."""
+    return search_response(
+        total_count=100,
+        page=1,
+        page_size=20,
+        articles=SEARCH_ARTICLES,
+        keyword="AI",
+    )
+
 
 class TestOAIResponse:
     """Test OAIResponse builder class."""
@@ -19,17 +76,11 @@ class TestOAIResponse:
             content="Found 10 items",
         )
 
-        assert "structuredContent" in response
-        assert "content" in response
-        assert "_meta" in response
+        _assert_oai(response)
 
-    def test_success_with_widget(self):
+    def test_success_with_widget(self, widget_success_response):
         """Success response includes widget template reference."""
-        response = OAIResponse.success(
-            structured={"data": "test"},
-            content="Test content",
-            widget="search_results",
-        )
+        response = widget_success_response
 
         assert response["_meta"]["openai/outputTemplate"] == "widget://search_results"
 
@@ -67,24 +118,26 @@ class TestOAIResponse:
         assert response["_meta"] == {}
         assert "time" in response["structuredContent"]
 
+    def test_inline_responses_share_empty_meta(self):
+        """Inline responses should not allocate a _meta dict each call."""
+        first = OAIResponse.inline(structured={}, content="a")
+        second = OAIResponse.inline(structured={}, content="b")
+
+        assert first["_meta"] is second["_meta"]
+
 
 class TestWidgetCSP:
     """Test Widget CSP configuration."""
 
-    def test_success_with_widget_includes_csp(self):
+    def test_success_with_widget_includes_csp(self, widget_success_response):
         """Widget responses should include CSP domains."""
-        response = OAIResponse.success(
-            structured={"test": "data"},
-            content="Test content",
-            widget="search_results",
-        )
+        response = widget_success_response
         assert "openai/widgetCSP" in response["_meta"]
         csp_domains = response["_meta"]["openai/widgetCSP"]
-        assert isinstance(csp_domains, list)
+        assert isinstance(csp_domains, tuple)
         assert len(csp_domains) > 0
         # Should include major Korean news domains
-        assert any("chosun.com" in d for d in csp_domains)
-        assert any("bigkinds.or.kr" in d for d in csp_domains)
+        assert _CSP_REQUIRED <= set(csp_domains)
 
     def test_inline_response_no_csp(self):
         """Inline responses without widget should not have CSP."""
@@ -98,24 +151,12 @@ class TestWidgetCSP:
 class TestSearchResponse:
     """Test search response builder."""
 
-    def test_search_response_structure(self):
+    def test_search_response_structure(self, search_resp):
         """Search response has correct OAI structure."""
-        articles = [
-            {"title": "AI News 1", "publisher": "경향신문", "date": "2025-01-01"},
-            {"title": "AI News 2", "publisher": "조선일보", "date": "2025-01-02"},
-        ]
-        response = search_response(
-            total_count=100,
-            page=1,
-            page_size=20,
-            articles=articles,
-            keyword="AI",
-        )
+        response = search_resp
 
         # Check 3형제
-        assert "structuredContent" in response
-        assert "content" in response
-        assert "_meta" in response
+        _assert_oai(response)
 
         # Check structuredContent is minimal
         sc = response["structuredContent"]
@@ -127,7 +168,7 @@ class TestSearchResponse:
         assert response["_meta"]["openai/outputTemplate"] == "widget://search_results"
 
         # Check full data in _meta
-        assert response["_meta"]["full_data"]["articles"] == articles
+        assert response["_meta"]["full_data"]["articles"] == SEARCH_ARTICLES
 
     def test_search_response_pagination(self):
         """Search response correctly calculates has_next."""
@@ -145,29 +186,24 @@ class TestSearchResponse:
 class TestArticleResponse:
     """Test article response builder."""
 
-    def test_article_response_structure(self):
+    def test_article_response_structure(self, article_resp):
         """Article response has correct structure."""
-        response = article_response(
-            news_id="123",
-            title="Test Article",
-            content_text="This is the article content" * 20,
-            publisher="경향신문",
-            published_date="2025-01-01T12:00:00",
-            url="https://example.com/article/123",
-        )
+        response = article_resp
 
         # Check 3형제
-        assert "structuredContent" in response
-        assert "content" in response
-        assert "_meta" in response
-
-        # Check structured has summary (truncated)
-        sc = response["structuredContent"]
-        assert len(sc.get("summary", "")) <= 200
+        _assert_oai(response)
 
         # Check widget
         assert response["_meta"]["openai/outputTemplate"] == "widget://article_detail"
 
+    def test_article_summary_truncated(self, article_resp, long_article):
+        """Structured summary is a truncated prefix of the content."""
+        summary = article_resp["structuredContent"]["summary"]
+
+        assert len(summary) <= 200
+        assert len(summary) < len(long_article)
+        assert long_article.startswith(summary)
+
 
 class TestTrendingResponse:
     """Test trending issues response builder."""
@@ -184,6 +220,7 @@ class TestTrendingResponse:
         )
 
         # Check 3형제
+        _assert_oai(response)
         sc = response["structuredContent"]
         assert sc["date"] == "2025-01-01"
         assert sc["issue_count"] == 2
@@ -194,3 +231,102 @@ class TestTrendingResponse:
 
         # Check widget
         assert response["_meta"]["openai/outputTemplate"] == "widget://trending_issues"
+
+
+class TestTimelineResponse:
+    """Test timeline analysis response builder."""
+
+    def test_timeline_response_peak(self):
+        """Peak should be the first date with the highest count."""
+        timeline = [
+            {"date": "2025-01-01", "count": 3},
+            {"date": "2025-01-02", "count": 7},
+            {"date": "2025-01-03", "count": 7},
+        ]
+        response = timeline_response(
+            keyword="AI",
+            start_date="2025-01-01",
+            end_date="2025-01-03",
+            timeline=timeline,
+            total_articles=17,
+        )
+
+        sc = response["structuredContent"]
+        assert sc["peak_date"] == "2025-01-02"
+        assert sc["peak_count"] == 7
+        assert "피크: 2025-01-02 7건" in response["content"]
+
+    def test_timeline_response_empty(self):
+        """Empty timeline should have no peak."""
+        response = timeline_response(
+            keyword="AI",
+            start_date="2025-01-01",
+            end_date="2025-01-03",
+            timeline=[],
+            total_articles=0,
+        )
+
+        sc = response["structuredContent"]
+        assert sc["peak_date"] is None
+        assert sc["peak_count"] == 0
+
+
+class TestSearchResponseTopArticles:
+    """Test pre-built top_articles handling."""
+
+    def test_prebuilt_top_articles_are_used(self, sample_articles):
+        """A caller-supplied preview should be used as-is."""
+        top = [{"title": "미리보기", "publisher": "경향신문", "date": "2025-01-01"}]
+        response = search_response(
+            total_count=2,
+            page=1,
+            page_size=20,
+            articles=sample_articles,
+            keyword="AI",
+            top_articles=top,
+        )
+
+        assert response["structuredContent"]["top_articles"] == top
+        assert response["_meta"]["full_data"]["articles"] == sample_articles
+
+
+class TestReportResponse:
+    """Test analysis report response builder."""
+
+    def test_report_response_summary_fields(self):
+        """Summary values should flow into structured and content."""
+        response = report_response(
+            keyword="AI",
+            start_date="2025-01-01",
+            end_date="2025-01-31",
+            summary={"total_articles": 1234, "publisher_count": 12, "peak_date": "2025-01-15", "peak_count": 88},
+            timeline=[],
+            publishers=[{"name": "경향신문", "count": 40}, {"name": "조선일보", "count": 30}],
+            key_events=[],
+            images=[],
+        )
+
+        sc = response["structuredContent"]
+        assert sc["period"] == "2025-01-01 ~ 2025-01-31"
+        assert sc["total_articles"] == 1234
+        assert sc["peak_date"] == "2025-01-15"
+        assert len(sc["top_publishers"]) == 2
+        assert "총 1,234건, 12개 언론사" in response["content"]
+        assert "피크: 2025-01-15 (88건)" in response["content"]
+        assert response["_meta"]["openai/outputTemplate"] == "widget://report"
+
+
+class TestTopProjection:
+    """Test the shared top-N projection helper."""
+
+    def test_top_projects_fields(self):
+        """Should keep only name and count of the first n items."""
+        from deep_news_oai.responses.builder import _top
+
+        items = [{"name": f"언론사{i}", "count": i, "extra": True} for i in range(5)]
+
+        assert _top(items, 2) == [
+            {"name": "언론사0", "count": 0},
+            {"name": "언론사1", "count": 1},
+        ]
+        assert _top([], 3) == []
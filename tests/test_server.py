@@ -1,23 +1,34 @@
 """Server and tools tests."""
 
+import asyncio
+
 import pytest
+from cachetools import TTLCache
 from starlette.testclient import TestClient
 
-from deep_news_oai.server import app, mcp
+from deep_news_oai import server
+from deep_news_oai.core.models import NewsArticle, SearchRequest
+from deep_news_oai.server import mcp
+from deep_news_oai.widgets.loader import load_widget
+
+
+@pytest.fixture(autouse=True)
+def fresh_tool_cache(monkeypatch):
+    """Give each test empty analysis tool caches."""
+    monkeypatch.setattr(server, "_tool_cache", TTLCache(maxsize=16, ttl=60))
+    monkeypatch.setattr(server, "_tool_error_cache", TTLCache(maxsize=16, ttl=60))
 
 
 class TestHealthCheck:
     """Health check endpoint tests."""
 
-    def test_health_endpoint_returns_200(self):
+    def test_health_endpoint_returns_200(self, client):
         """Health endpoint should return 200."""
-        client = TestClient(app)
         response = client.get("/health")
         assert response.status_code == 200
 
-    def test_health_response_structure(self):
+    def test_health_response_structure(self, client):
         """Health response should have required fields."""
-        client = TestClient(app)
         response = client.get("/health")
         data = response.json()
 
@@ -26,6 +37,78 @@ class TestHealthCheck:
         assert "service" in data
         assert data["service"] == "deep-news-oai"
 
+    def test_health_reports_client_state(self, client, monkeypatch):
+        """client_initialized should track the BigKinds client."""
+        monkeypatch.setattr(server, "_client", None)
+        pending = client.get("/health")
+        monkeypatch.setattr(server, "_client", object())
+        ready = client.get("/health")
+
+        assert pending.headers["content-type"] == "application/json"
+        assert pending.json()["client_initialized"] is False
+        assert ready.json()["client_initialized"] is True
+
+
+class TestLifespan:
+    """App lifespan tests."""
+
+    def test_startup_and_shutdown_hooks_run(self, monkeypatch):
+        """Entering the app should create clients; leaving should close them."""
+        events = []
+
+        class FakeBigKinds:
+            async def close(self):
+                events.append("client.close")
+
+        async def fake_close_shared():
+            events.append("close_shared_client")
+
+        monkeypatch.setattr(server, "_client", None)
+        monkeypatch.setattr(server, "_trends_client", None)
+        monkeypatch.setattr(server, "BigKindsClient", FakeBigKinds)
+        monkeypatch.setattr(server, "GoogleTrendsClient", lambda: "trends")
+        monkeypatch.setattr(server, "close_shared_client", fake_close_shared)
+
+        with TestClient(server.app) as client:
+            assert isinstance(server._client, FakeBigKinds)
+            assert server._trends_client == "trends"
+            assert client.get("/health").json()["client_initialized"] is True
+
+        assert events == ["client.close", "close_shared_client"]
+
+
+class TestWidgetHttp:
+    """Plain HTTP widget route tests."""
+
+    def test_serves_gzipped_widget_with_etag(self, client):
+        """Should serve the widget HTML with an ETag."""
+        response = client.get("/widgets/timeline.html")
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"]
+        assert "window.openai" in response.text
+
+    def test_serves_identity_without_gzip(self, client):
+        """Clients that don't accept gzip should get the raw HTML bytes."""
+        response = client.get("/widgets/timeline.html", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in response.headers
+        assert response.text == load_widget("timeline")
+
+    def test_matching_etag_returns_304(self, client):
+        """A matching If-None-Match should return 304 with no body."""
+        etag = client.get("/widgets/timeline.html").headers["etag"]
+
+        response = client.get("/widgets/timeline.html", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_unknown_widget_returns_404(self, client):
+        """Unknown widget names should return 404."""
+        assert client.get("/widgets/missing.html").status_code == 404
+
 
 class TestMCPServer:
     """MCP server configuration tests."""
@@ -38,10 +121,8 @@ class TestMCPServer:
 class TestToolsRegistration:
     """Tool registration tests."""
 
-    def test_tools_are_registered(self):
+    def test_tools_are_registered(self, tool_names):
         """Required tools should be registered."""
-        tool_names = [t.name for t in mcp._tool_manager.list_tools()]
-
         required_tools = [
             "search_korean_news",
             "count_news_articles",
@@ -53,12 +134,9 @@ class TestToolsRegistration:
         for tool in required_tools:
             assert tool in tool_names, f"Tool {tool} should be registered"
 
-    def test_search_tool_has_parameters(self):
+    def test_search_tool_has_parameters(self, tool_names):
         """search_korean_news should have required parameters."""
-        tools = mcp._tool_manager.list_tools()
-        search_tool = next((t for t in tools if t.name == "search_korean_news"), None)
-
-        assert search_tool is not None
+        assert "search_korean_news" in tool_names
 
         # Check parameters exist in the tool's function signature
         import inspect
@@ -70,3 +148,365 @@ class TestToolsRegistration:
         required_params = ["keyword", "start_date", "end_date"]
         for param in required_params:
             assert param in params, f"Parameter {param} should exist"
+
+
+class TestGetArticleDetail:
+    """get_article_detail tool tests."""
+
+    async def test_resolves_all_images_in_one_batch(self, fake_bigkinds):
+        """Comma-separated IMAGES should be resolved with a single batch call."""
+        news_id = "01101202.20241220110009001"
+        article = NewsArticle.from_api_response({
+            "NEWS_ID": news_id,
+            "TITLE": "기사",
+            "IMAGES": "https://www.bigkinds.or.kr/a, https://www.bigkinds.or.kr/b",
+        })
+        fake = fake_bigkinds([article])
+        fake.resolve = lambda urls: [f"{u}.jpg" for u in urls[:1]] + [""] * (len(urls) - 1)
+
+        result = await server.get_article_detail(news_id)
+
+        assert fake.batches == [["https://www.bigkinds.or.kr/a", "https://www.bigkinds.or.kr/b"]]
+        assert result["_meta"]["full_data"]["images"] == ["https://www.bigkinds.or.kr/a.jpg"]
+
+    async def test_looks_up_article_by_news_id(self, fake_bigkinds):
+        """The first search should filter by the exact news ID."""
+        news_id = "01101202.20241220110009001"
+        fake = fake_bigkinds([NewsArticle.from_api_response({"NEWS_ID": news_id, "TITLE": "기사"})])
+
+        result = await server.get_article_detail(news_id)
+
+        assert len(fake.calls) == 1
+        assert fake.calls[0].news_ids == [news_id]
+        assert fake.calls[0].to_api_payload()["newsIds"] == [news_id]
+        assert result["structuredContent"]["news_id"] == news_id
+
+    async def test_falls_back_to_provider_scan(self, fake_bigkinds):
+        """Should scan the provider's articles when the ID filter finds nothing."""
+        news_id = "01101202.20241220110009001"
+        provider_articles = [
+            NewsArticle.from_api_response({"NEWS_ID": f"01101202.2024122011000900{i}", "TITLE": f"기사 {i}"})
+            for i in range(3)
+        ]
+        fake = fake_bigkinds(lambda request: [] if request.news_ids else provider_articles)
+
+        result = await server.get_article_detail(news_id)
+
+        assert len(fake.calls) == 2
+        assert fake.calls[1].provider_codes == ["01101202"]
+        assert result["structuredContent"]["title"] == "기사 1"
+
+
+class TestCategoryLookup:
+    """list_news_providers / find_news_category tests."""
+
+    async def test_find_category_exact_and_substring(self):
+        """Exact and partial queries should both resolve to category codes."""
+        exact = await server.find_news_category("경제")
+        partial = await server.find_news_category("it")
+
+        assert exact["structuredContent"]["matches"] == [
+            {"name": "경제", "code": "002000000", "type": "category"}
+        ]
+        assert [m["name"] for m in partial["structuredContent"]["matches"]] == ["IT_과학"]
+
+    async def test_find_category_no_match(self):
+        """Unknown queries should list the available categories."""
+        result = await server.find_news_category("날씨")
+
+        assert result["structuredContent"]["matches"] == []
+        assert "정치, 경제" in result["content"]
+
+    async def test_list_providers(self):
+        """Provider totals should cover every group."""
+        result = await server.list_news_providers()
+
+        assert result["structuredContent"]["provider_count"] == 29
+        assert result["structuredContent"]["categories"][0] == "전국일간지"
+
+
+class TestGetKoreanTime:
+    """get_korean_time tool tests."""
+
+    async def test_same_second_reuses_response(self, monkeypatch):
+        """Calls within one second should share the response."""
+        monkeypatch.setattr(server, "_korean_time_cache", (-1, None))
+        monkeypatch.setattr(server.time, "time", lambda: 1735689600.25)
+
+        first = await server.get_korean_time()
+        second = await server.get_korean_time()
+
+        assert first is second
+        assert first["structuredContent"]["timezone"] == "KST (UTC+9)"
+        assert first["structuredContent"]["datetime"].endswith("+09:00")
+
+    async def test_tool_call_serializes(self):
+        """Inline tool results should pass through FastMCP serialization."""
+        content, structured = await mcp.call_tool("get_korean_time", {})
+
+        assert structured["_meta"] == {}
+        assert "한국 시간" in structured["content"]
+
+
+class TestCachedSearch:
+    """Single-flight search cache tests."""
+
+    REQUEST = SearchRequest(keyword="AI", start_date="2025-01-01", end_date="2025-01-31")
+
+    async def test_concurrent_searches_share_one_call(self, fake_bigkinds):
+        """Identical concurrent searches should hit BigKinds once."""
+        fake = fake_bigkinds(delay=0.01)
+
+        results = await asyncio.gather(*(server._cached_search(self.REQUEST) for _ in range(3)))
+        again = await server._cached_search(self.REQUEST.model_copy())
+
+        assert len(fake.calls) == 1
+        assert results[0] is results[1] is results[2] is again
+
+    async def test_cancelled_leader_does_not_cancel_followers(self, fake_bigkinds):
+        """A follower should still get the result if the first caller is cancelled."""
+        fake = fake_bigkinds(delay=0.01)
+
+        leader = asyncio.create_task(server._cached_search(self.REQUEST))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(server._cached_search(self.REQUEST))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        response = await follower
+
+        assert leader.cancelled()
+        assert response.success is True
+        assert len(fake.calls) == 1
+
+    async def test_failed_searches_are_not_cached(self, fake_bigkinds):
+        """Unsuccessful responses should be retried on the next call."""
+        fake = fake_bigkinds(delay=0.01)
+        fake.success = False
+
+        await server._cached_search(self.REQUEST)
+        await server._cached_search(self.REQUEST)
+
+        assert len(fake.calls) == 2
+
+
+class TestGenerateReport:
+    """generate_report tool tests."""
+
+    async def test_report_aggregates_in_one_pass(self, fake_bigkinds):
+        """Timeline, publishers, peak and images should come from one fetch."""
+        rows = [
+            ("2025-01-01", "경향신문", "https://www.bigkinds.or.kr/a"),
+            ("2025-01-02", "경향신문", None),
+            ("2025-01-02", "조선일보", "https://www.bigkinds.or.kr/b"),
+            ("2025-01-03", "조선일보", None),
+        ]
+        fake = fake_bigkinds([
+            NewsArticle.from_api_response({
+                "TITLE": f"기사 {i}",
+                "NEWS_DATE": f"{date}T09:00:00",
+                "PROVIDER": pub,
+                **({"IMAGES": img} if img else {}),
+            })
+            for i, (date, pub, img) in enumerate(rows)
+        ])
+        fake.resolve = lambda urls: [f"{u}.jpg" for u in urls]
+
+        result = await server.generate_report("AI", "2025-01-01", "2025-01-03")
+        data = result["_meta"]["full_data"]
+
+        assert [t["count"] for t in data["timeline"]] == [1, 2, 1]
+        assert data["summary"]["peak_date"] == "2025-01-02"
+        assert data["summary"]["publisher_count"] == 2
+        assert [i["url"] for i in data["images"]] == [
+            "https://www.bigkinds.or.kr/a.jpg",
+            "https://www.bigkinds.or.kr/b.jpg",
+        ]
+        assert any(e["is_peak"] for e in data["key_events"])
+
+    async def test_image_candidates_capped_at_twelve(self, fake_bigkinds):
+        """Only the first 12 distinct image URLs should be resolved."""
+        fake = fake_bigkinds([
+            NewsArticle.from_api_response({
+                "TITLE": f"기사 {i}",
+                "NEWS_DATE": "2025-01-01T09:00:00",
+                "IMAGES": f"https://www.bigkinds.or.kr/{i % 15}",
+            })
+            for i in range(30)
+        ])
+
+        await server.generate_report("AI", "2025-01-01", "2025-01-01")
+
+        assert fake.batches == [[f"https://www.bigkinds.or.kr/{i}" for i in range(12)]]
+
+
+class TestWeekStart:
+    """Weekly timeline bucketing tests."""
+
+    def test_week_start_is_monday(self):
+        """Dates should bucket to the Monday of their week."""
+        assert server._week_start("2025-01-01") == "2024-12-30"  # Wednesday
+        assert server._week_start("2024-12-30") == "2024-12-30"  # Monday
+        assert server._week_start("2025-01-05") == "2024-12-30"  # Sunday
+
+    def test_week_start_rejects_bad_dates(self):
+        """Malformed dates should raise ValueError like strptime did."""
+        with pytest.raises(ValueError):
+            server._week_start("2025-13-01")
+
+
+class TestAnalyzeAll:
+    """analyze_all tool tests."""
+
+    async def test_one_fetch_for_all_analyses(self, fake_bigkinds):
+        """The combined tool should fetch once and return all three analyses."""
+        fake = fake_bigkinds([
+            NewsArticle.from_api_response({
+                "TITLE": f"기사 {i}",
+                "NEWS_DATE": f"2025-01-0{i % 3 + 1}T09:00:00",
+                "PROVIDER": "경향신문" if i % 2 else "조선일보",
+            })
+            for i in range(6)
+        ])
+
+        result = await server.analyze_all("AI", "2025-01-01", "2025-01-03")
+
+        assert len(fake.calls) == 1
+        sc = result["structuredContent"]
+        assert sc["timeline"]["data_points"] == 3
+        assert sc["perspectives"]["publisher_count"] == 2
+        assert sc["report"]["total_articles"] == 6
+        assert result["_meta"]["openai/outputTemplate"] == "widget://report"
+        assert "timeline" in result["_meta"] and "perspectives" in result["_meta"]
+
+        # Separate tool calls reuse the same fetch
+        await server.analyze_timeline("AI", "2025-01-01", "2025-01-03")
+        assert len(fake.calls) == 1
+
+    @pytest.mark.parametrize("dates", [
+        ["2025-01-03", "2025-01-02", "2025-01-01"],
+        ["2025-01-02", "2025-01-03", "2025-01-01", "2025-01-02"],
+    ])
+    async def test_timeline_is_ascending(self, fake_bigkinds, dates):
+        """Timelines should run oldest first for sorted and unsorted input."""
+        fake_bigkinds([
+            NewsArticle.from_api_response({"TITLE": "기사", "NEWS_DATE": f"{d}T09:00:00"})
+            for d in dates
+        ])
+
+        result = await server.analyze_timeline("AI", "2025-01-01", "2025-01-03")
+        timeline = result["_meta"]["full_data"]["timeline"]
+
+        assert [t["date"] for t in timeline] == ["2025-01-01", "2025-01-02", "2025-01-03"]
+        assert sum(t["count"] for t in timeline) == len(dates)
+
+
+class TestToolResultCache:
+    """Analysis tool result cache tests."""
+
+    @pytest.fixture
+    def fake(self, fake_bigkinds):
+        """Install a fake client returning one article."""
+        return fake_bigkinds([
+            NewsArticle.from_api_response({
+                "TITLE": "기사", "NEWS_DATE": "2025-01-01T09:00:00", "PROVIDER": "경향신문",
+            })
+        ])
+
+    async def test_repeat_call_returns_cached_result(self, fake):
+        """Identical calls should return the stored result without recomputing."""
+        first = await server.compare_perspectives("AI", "2025-01-01", "2025-01-02")
+        server._search_cache.clear()
+        second = await server.compare_perspectives("AI", "2025-01-01", "2025-01-02", limit=10)
+        other = await server.compare_perspectives("AI", "2025-01-01", "2025-01-02", limit=3)
+
+        assert second is first
+        assert other is not first
+        assert len(fake.calls) == 2
+
+    async def test_concurrent_calls_compute_once(self, fake):
+        """Concurrent identical calls should share one result."""
+        results = await asyncio.gather(
+            *(server.analyze_timeline("AI", "2025-01-01", "2025-01-02") for _ in range(5))
+        )
+
+        assert all(r is results[0] for r in results)
+        assert len(fake.calls) == 1
+        assert server._tool_locks == {}
+
+    async def test_lock_is_shared_until_last_waiter(self):
+        """A caller arriving after a release should queue behind woken waiters."""
+        active = peak = 0
+
+        @server._async_ttl_cache
+        async def tool(keyword: str):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return server.OAIResponse.error("API_ERROR", "not cached")
+
+        first = asyncio.create_task(tool("AI"))
+        second = asyncio.create_task(tool("AI"))
+        await first
+        third = asyncio.create_task(tool("AI"))
+        await asyncio.gather(second, third)
+
+        assert peak == 1
+        assert server._tool_locks == {}
+
+    async def test_api_errors_are_not_cached(self, fake):
+        """Failed searches should be retried on the next call."""
+        fake.success = False
+        failed = await server.analyze_timeline("AI", "2025-01-01", "2025-01-02")
+        fake.success = True
+        retried = await server.analyze_timeline("AI", "2025-01-01", "2025-01-02")
+
+        assert failed["structuredContent"]["code"] == "API_ERROR"
+        assert "error" not in retried["structuredContent"]
+
+    async def test_tool_schema_keeps_parameters(self):
+        """The cache wrapper should not hide tool parameters from MCP."""
+        tools = {t.name: t for t in await mcp.list_tools()}
+
+        assert set(tools["analyze_all"].inputSchema["properties"]) == {
+            "keyword", "start_date", "end_date", "granularity", "limit",
+        }
+
+
+class TestComparePerspectives:
+    """compare_perspectives tool tests."""
+
+    async def test_uses_date_sorted_buckets(self, fake_bigkinds):
+        """Date range and headlines should follow the newest-first search order."""
+        dates = ["2025-01-09", "2025-01-07", "2025-01-05", "2025-01-03", "2025-01-02", "2025-01-01"]
+        fake = fake_bigkinds([
+            NewsArticle.from_api_response({"TITLE": f"기사 {d}", "NEWS_DATE": f"{d}T09:00:00", "PROVIDER": "경향신문"})
+            for d in dates
+        ])
+
+        result = await server.compare_perspectives("AI", "2025-01-01", "2025-01-09")
+        publisher = result["_meta"]["full_data"]["publishers"][0]
+
+        assert fake.calls[0].sort_method == "date"
+        assert publisher["first_date"] == "2025-01-01"
+        assert publisher["last_date"] == "2025-01-09"
+        assert [h["date"] for h in publisher["headlines"]] == dates[:5]
+
+
+class TestUninitializedServer:
+    """Tool behaviour before the lifespan has created clients."""
+
+    async def test_tools_return_shared_server_error(self, monkeypatch):
+        """Tools should fail fast with the precomputed SERVER_ERROR response."""
+        monkeypatch.setattr(server, "_client", None)
+        monkeypatch.setattr(server, "_trends_client", None)
+
+        search = await server.search_korean_news("AI", "2025-01-01", "2025-01-31")
+        report = await server.generate_report("AI", "2025-01-01", "2025-01-31")
+        trending = await server.get_trending_now()
+
+        assert search is report is server._ERR_NO_CLIENT
+        assert search["structuredContent"]["code"] == "SERVER_ERROR"
+        assert trending is server._ERR_NO_TRENDS
@@ -1,12 +1,47 @@
 """Google Trends integration tests."""
 
+import os
+import pickle
+import shutil
+import time
 from datetime import datetime
-from pathlib import Path
 import pytest
 
+from deep_news_oai.core import trends
 from deep_news_oai.core.trends import GoogleTrendsClient, TrendingItem
 
 
+# Synthetic parsed rows, already sorted by rank like _load_cache output
+PREBUILT_ITEMS = [
+    TrendingItem(rank=i, keyword=f"키워드{i}", search_volume="1만+", related_terms=[f"관련{i}"])
+    for i in range(1, 11)
+]
+
+
+@pytest.fixture
+def stub_trends_client(monkeypatch, tmp_path):
+    """Client whose loader returns PREBUILT_ITEMS without touching disk."""
+
+    def load_prebuilt(self):
+        self._cache = list(PREBUILT_ITEMS)
+        self._cache_loaded_at = datetime.now()
+        self._cache_loaded_monotonic = time.monotonic()
+        return self._cache
+
+    monkeypatch.setattr(GoogleTrendsClient, "_load_cache", load_prebuilt)
+    return GoogleTrendsClient(cache_path=tmp_path / "unused.csv")
+
+
+@pytest.fixture(scope="module")
+def trends_client(tmp_path_factory):
+    """Client over a copy of the default CSV, loaded once for read-only tests."""
+    cache_path = tmp_path_factory.mktemp("trends") / "google_trends_cache.csv"
+    shutil.copy(GoogleTrendsClient.DEFAULT_CACHE_PATH, cache_path)
+    client = GoogleTrendsClient(cache_path=cache_path)
+    client.get_trending(limit=1)
+    return client
+
+
 class TestTrendingItem:
     """TrendingItem dataclass tests."""
 
@@ -61,39 +96,30 @@ class TestGoogleTrendsClient:
         assert "data" in str(client.cache_path)
         assert "google_trends_cache.csv" in str(client.cache_path)
 
-    def test_get_trending_returns_list(self):
+    def test_get_trending_returns_list(self, stub_trends_client):
         """Should return list of TrendingItem."""
-        client = GoogleTrendsClient()
-
-        result = client.get_trending(limit=5)
+        result = stub_trends_client.get_trending(limit=5)
 
         assert isinstance(result, list)
-        if result:
-            assert isinstance(result[0], TrendingItem)
+        assert all(isinstance(item, TrendingItem) for item in result)
 
-    def test_get_trending_respects_limit(self):
+    def test_get_trending_respects_limit(self, stub_trends_client):
         """Should respect the limit parameter."""
-        client = GoogleTrendsClient()
-
-        result = client.get_trending(limit=3)
+        result = stub_trends_client.get_trending(limit=3)
 
-        assert len(result) <= 3
+        assert len(result) == 3
 
-    def test_get_trending_sorted_by_rank(self):
+    def test_get_trending_sorted_by_rank(self, stub_trends_client):
         """Results should be sorted by rank."""
-        client = GoogleTrendsClient()
-
-        result = client.get_trending(limit=10)
+        result = stub_trends_client.get_trending(limit=10)
 
-        if len(result) > 1:
-            ranks = [item.rank for item in result]
-            assert ranks == sorted(ranks)
+        ranks = [item.rank for item in result]
+        assert ranks == sorted(ranks)
+        assert len(ranks) == 10
 
-    def test_get_cache_status(self):
+    def test_get_cache_status(self, trends_client):
         """Should return cache status dictionary."""
-        client = GoogleTrendsClient()
-
-        status = client.get_cache_status()
+        status = trends_client.get_cache_status()
 
         assert "cache_path" in status
         assert "cache_exists" in status
@@ -101,27 +127,78 @@ class TestGoogleTrendsClient:
         assert "items_count" in status
         assert "max_age_hours" in status
 
-    def test_cache_validation(self):
-        """Cache should be validated based on max_age."""
+    def test_cache_initially_invalid(self):
+        """Cache should not be valid before anything is loaded."""
         client = GoogleTrendsClient(cache_max_age_hours=6)
 
-        # Initially cache is not valid (not loaded)
         assert not client._is_cache_valid()
 
-        # After loading, cache should be valid
-        client.get_trending(limit=1)
-        assert client._is_cache_valid()
+    def test_cache_validation(self, trends_client):
+        """Cache should be valid once loaded."""
+        assert trends_client._is_cache_valid()
 
-    def test_get_trending_with_context(self):
+    def test_get_trending_with_context(self, stub_trends_client):
         """Should return list of dicts with news hints."""
+        result = stub_trends_client.get_trending_with_context(limit=3)
+
+        assert [r["keyword"] for r in result] == ["키워드1", "키워드2", "키워드3"]
+        assert "키워드1" in result[0]["news_hint"]
+
+    def test_arrow_reader_matches_csv_reader(self):
+        """pyarrow and csv module readers should produce the same rows."""
+        pytest.importorskip("pyarrow")
         client = GoogleTrendsClient()
 
-        result = client.get_trending_with_context(limit=3)
+        arrow_rows = [list(row) for row in client._read_rows_arrow()]
+        csv_rows = [row for row in client._read_rows() if row[1].strip()]
 
-        assert isinstance(result, list)
-        if result:
-            assert "keyword" in result[0]
-            assert "news_hint" in result[0]
+        assert arrow_rows == csv_rows
+
+
+class TestTrendsSnapshot:
+    """Pickle snapshot tests."""
+
+    def test_snapshot_written_and_reused(self, tmp_path):
+        """Parsed items should be snapshotted and reused on the next load."""
+        cache_path = tmp_path / "trends.csv"
+        shutil.copy(GoogleTrendsClient.DEFAULT_CACHE_PATH, cache_path)
+
+        first = GoogleTrendsClient(cache_path=cache_path).get_trending(limit=5)
+        assert cache_path.with_suffix(".pkl").exists()
+
+        client = GoogleTrendsClient(cache_path=cache_path)
+        client._read_rows = client._read_rows_arrow = None  # Would fail if used
+        second = client.get_trending(limit=5)
+
+        assert [i.keyword for i in second] == [i.keyword for i in first]
+
+    def test_stale_snapshot_ignored(self, tmp_path):
+        """A snapshot older than the CSV should not be used."""
+        cache_path = tmp_path / "trends.csv"
+        cache_path.write_text("rank,search_term\n1,새 키워드\n", encoding="utf-8")
+        snapshot = cache_path.with_suffix(".pkl")
+        snapshot.write_bytes(b"stale")
+        os.utime(snapshot, (0, 0))
+
+        result = GoogleTrendsClient(cache_path=cache_path).get_trending()
+
+        assert [i.keyword for i in result] == ["새 키워드"]
+
+    @pytest.mark.parametrize("payload", [
+        (0, [TrendingItem(rank=1, keyword="옛 키워드")]),
+        [TrendingItem(rank=1, keyword="옛 키워드")],
+    ])
+    def test_mismatched_snapshot_version_ignored(self, tmp_path, payload):
+        """Snapshots from another format version should be re-parsed from CSV."""
+        cache_path = tmp_path / "trends.csv"
+        cache_path.write_text("rank,search_term\n1,새 키워드\n", encoding="utf-8")
+        snapshot = cache_path.with_suffix(".pkl")
+        snapshot.write_bytes(pickle.dumps(payload))
+
+        result = GoogleTrendsClient(cache_path=cache_path).get_trending()
+
+        assert [i.keyword for i in result] == ["새 키워드"]
+        assert pickle.loads(snapshot.read_bytes())[0] == trends.SNAPSHOT_VERSION
 
 
 class TestGoogleTrendsClientWithMissingFile:
@@ -1,10 +1,29 @@
 """Widget loading tests."""
 
-from pathlib import Path
+import gzip
+import re
 
 import pytest
 
-from deep_news_oai.widgets.loader import load_widget, clear_widget_cache, WIDGET_DIR
+from deep_news_oai.widgets import loader
+from deep_news_oai.widgets.loader import (
+    load_widget,
+    load_widget_bytes,
+    load_widget_gzip,
+    widget_etag,
+    clear_widget_cache,
+    WIDGET_DIR,
+)
+
+_FEATURES = re.compile(r"dark|light|notifyIntrinsicHeight|[\uac00-\ud7a3]")
+
+WIDGET_NAMES = ["search_results", "article_detail", "trending_issues", "timeline", "perspectives", "report"]
+
+
+@pytest.fixture(scope="session")
+def all_widgets():
+    """Every widget's HTML, loaded once."""
+    return {name: load_widget(name) for name in WIDGET_NAMES}
 
 
 class TestWidgetLoader:
@@ -15,96 +34,85 @@ class TestWidgetLoader:
         assert WIDGET_DIR.exists()
         assert WIDGET_DIR.is_dir()
 
-    def test_load_search_results_widget(self):
-        """Should load search_results widget."""
-        html = load_widget("search_results")
-        assert "<!DOCTYPE html>" in html
-        assert "window.openai" in html
-        assert "search" in html.lower() or "articles" in html.lower()
-
-    def test_load_article_detail_widget(self):
-        """Should load article_detail widget."""
-        html = load_widget("article_detail")
-        assert "<!DOCTYPE html>" in html
-        assert "window.openai" in html
-        assert "article" in html.lower()
-
-    def test_load_trending_issues_widget(self):
-        """Should load trending_issues widget."""
-        html = load_widget("trending_issues")
-        assert "<!DOCTYPE html>" in html
-        assert "window.openai" in html
-        assert "issues" in html.lower() or "이슈" in html
-
-    def test_load_timeline_widget(self):
-        """Should load timeline widget."""
-        html = load_widget("timeline")
-        assert "<!DOCTYPE html>" in html
-        assert "window.openai" in html
-        assert "timeline" in html.lower() or "타임라인" in html
-
-    def test_load_perspectives_widget(self):
-        """Should load perspectives widget."""
-        html = load_widget("perspectives")
-        assert "<!DOCTYPE html>" in html
-        assert "window.openai" in html
-        assert "publisher" in html.lower() or "언론사" in html
+    @pytest.mark.parametrize("name,keywords", [
+        ("search_results", ("search", "articles")),
+        ("article_detail", ("article",)),
+        ("trending_issues", ("issues", "이슈")),
+        ("timeline", ("timeline", "타임라인")),
+        ("perspectives", ("publisher", "언론사")),
+        ("report", ("report", "리포트", "분석")),
+    ])
+    def test_load_widget(self, name, keywords, all_widgets):
+        """Each widget should be an OpenAI widget page about its topic."""
+        html = all_widgets[name]
+        lowered = html.lower()
 
-    def test_load_report_widget(self):
-        """Should load report widget."""
-        html = load_widget("report")
         assert "<!DOCTYPE html>" in html
         assert "window.openai" in html
-        assert "report" in html.lower() or "리포트" in html or "분석" in html
+        assert any(k in lowered for k in keywords)
 
     def test_load_nonexistent_widget(self):
         """Should return fallback for nonexistent widget."""
         html = load_widget("nonexistent_widget")
         assert "not found" in html.lower()
 
-    def test_widgets_have_theme_support(self):
-        """All widgets should support dark/light themes."""
-        widgets = ["search_results", "article_detail", "trending_issues", "timeline", "perspectives", "report"]
-        for name in widgets:
-            html = load_widget(name)
-            assert "dark" in html, f"{name} should support dark theme"
-            assert "light" in html, f"{name} should support light theme"
-
-    def test_widgets_have_korean_content(self):
-        """Widgets should have Korean UI text."""
-        widgets = ["search_results", "article_detail", "trending_issues", "timeline", "perspectives", "report"]
-        for name in widgets:
-            html = load_widget(name)
-            # Check for Korean characters
-            has_korean = any('\uac00' <= c <= '\ud7a3' for c in html)
-            assert has_korean, f"{name} should have Korean content"
+    @pytest.mark.parametrize("name", WIDGET_NAMES)
+    def test_widget_features(self, name, all_widgets):
+        """Each widget should support themes, Korean UI and intrinsic height."""
+        found = set(_FEATURES.findall(all_widgets[name]))
 
-    def test_widget_caching(self):
-        """Widget loader should cache results."""
-        clear_widget_cache()  # Start fresh
+        assert "dark" in found, f"{name} should support dark theme"
+        assert "light" in found, f"{name} should support light theme"
+        assert found - {"dark", "light", "notifyIntrinsicHeight"}, f"{name} should have Korean content"
+        assert "notifyIntrinsicHeight" in found, f"{name} should call notifyIntrinsicHeight"
+
+    def test_all_widgets_preloaded(self):
+        """Every widget file should be loaded at import."""
+        assert set(loader._WIDGETS) == {p.stem for p in WIDGET_DIR.glob("*.html")}
+
+    def test_gzip_round_trips_to_html(self):
+        """Precompressed bodies should decompress to the widget HTML."""
+        body = load_widget_gzip("report")
+
+        assert gzip.decompress(body).decode("utf-8") == load_widget("report")
+        assert load_widget_gzip("nonexistent_widget") is None
+
+    def test_bytes_match_html(self):
+        """Raw bytes should be the UTF-8 encoding of the widget HTML."""
+        assert load_widget_bytes("report") == load_widget("report").encode("utf-8")
+        assert load_widget_bytes("nonexistent_widget") is None
 
-        # First call should cache
+
+class TestWidgetCacheBehavior:
+    """Tests that reload the widget tables."""
+
+    @pytest.fixture(autouse=True)
+    def restore_widget_tables(self, monkeypatch):
+        """Put the import-time widget tables back after each test."""
+        for name in ("_WIDGET_BYTES", "_WIDGETS", "_WIDGET_GZIP", "_WIDGET_ETAG"):
+            monkeypatch.setattr(loader, name, getattr(loader, name))
+
+    def test_widget_caching(self):
+        """Widgets should be preloaded and returned without re-reading."""
         html1 = load_widget("search_results")
-        # Second call should return cached value
         html2 = load_widget("search_results")
 
-        assert html1 is html2, "Cached widget should be same object"
-
-        # Check cache info
-        cache_info = load_widget.cache_info()
-        assert cache_info.hits >= 1, "Should have cache hits"
+        assert html1 is html2, "Preloaded widget should be same object"
 
     def test_clear_widget_cache(self):
-        """clear_widget_cache should clear the LRU cache."""
-        load_widget("search_results")
+        """clear_widget_cache should re-read widgets from disk."""
+        before = load_widget("search_results")
         clear_widget_cache()
+        after = load_widget("search_results")
+
+        assert after == before
+        assert after is not before, "Widgets should be re-read after clear"
 
-        cache_info = load_widget.cache_info()
-        assert cache_info.currsize == 0, "Cache should be empty after clear"
+    def test_etag_is_stable(self):
+        """ETags should survive a re-read of unchanged files."""
+        before = widget_etag("report")
+        clear_widget_cache()
 
-    def test_widgets_have_intrinsic_height(self):
-        """All widgets should notify host of intrinsic height."""
-        widgets = ["search_results", "article_detail", "trending_issues", "timeline", "perspectives", "report"]
-        for name in widgets:
-            html = load_widget(name)
-            assert "notifyIntrinsicHeight" in html, f"{name} should call notifyIntrinsicHeight"
+        assert widget_etag("report") == before
+        assert before.startswith('"') and before.endswith('"')
+        assert widget_etag("report") != widget_etag("timeline")